@@ -1,6 +1,7 @@
 """
 MatrixEditor: Modal dialog for creating and editing matrices.
 """
+from contextlib import contextmanager
 from typing import Optional
 import numpy as np
 
@@ -9,8 +10,7 @@ from PySide6.QtWidgets import (
     QLineEdit, QSpinBox, QTableWidget, QTableWidgetItem,
     QPushButton, QWidget, QLabel, QMessageBox
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QDoubleValidator
+from PySide6.QtCore import Qt, QTimer
 
 
 class MatrixEditor(QDialog):
@@ -101,7 +101,13 @@ class MatrixEditor(QDialog):
             }
         """)
         
-        # Connect cell change to auto-resize columns
+        # Connect cell change to auto-resize columns, coalescing bursts of
+        # edits (e.g. typing digits) into one resize pass per column
+        self._pending_resize_cols: set = set()
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._do_pending_resizes)
         self.table.itemChanged.connect(self._on_cell_changed)
         
         self._init_table()
@@ -125,27 +131,56 @@ class MatrixEditor(QDialog):
         # Auto-resize dialog to fit content
         self._resize_to_fit_content()
     
+    @contextmanager
+    def _bulk_update(self):
+        """
+        Batch table population: suppress per-cell itemChanged signals and
+        repaints, then do a single column resize at the end instead of one
+        layout pass per cell.
+        """
+        self.table.blockSignals(True)
+        self.table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.blockSignals(False)
+            self.table.resizeColumnsToContents()
+
     def _init_table(self) -> None:
         """Initialize table with zero values."""
         rows = self.rows_spin.value()
         cols = self.cols_spin.value()
         self.table.setRowCount(rows)
         self.table.setColumnCount(cols)
-        
-        for r in range(rows):
-            for c in range(cols):
-                item = QTableWidgetItem("0")
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(r, c, item)
-    
+
+        with self._bulk_update():
+            item_at = self.table.item
+            set_item = self.table.setItem
+            align = Qt.AlignmentFlag.AlignCenter
+            for r in range(rows):
+                for c in range(cols):
+                    cell = item_at(r, c)
+                    if cell is None:
+                        cell = QTableWidgetItem()
+                        cell.setTextAlignment(align)
+                        set_item(r, c, cell)
+                    cell.setText("0")
+
     def _on_cell_changed(self, item: QTableWidgetItem) -> None:
-        """Auto-resize column when cell content changes."""
+        """Queue a column resize when cell content changes."""
         if item:
-            col = item.column()
+            self._pending_resize_cols.add(item.column())
+            self._resize_timer.start()
+
+    def _do_pending_resizes(self) -> None:
+        """Resize each changed column once after an edit burst."""
+        for col in self._pending_resize_cols:
             self.table.resizeColumnToContents(col)
             # Ensure minimum width
             if self.table.columnWidth(col) < 50:
                 self.table.setColumnWidth(col, 50)
+        self._pending_resize_cols.clear()
     
     def _resize_to_fit_content(self) -> None:
         """Resize dialog to fit table content with minimal dead space."""
@@ -172,19 +207,21 @@ class MatrixEditor(QDialog):
         rows = self.rows_spin.value()
         cols = self.cols_spin.value()
         
-        old_rows = self.table.rowCount()
-        old_cols = self.table.columnCount()
-        
         self.table.setRowCount(rows)
         self.table.setColumnCount(cols)
-        
-        # Initialize new cells
-        for r in range(rows):
-            for c in range(cols):
-                if r >= old_rows or c >= old_cols:
-                    item = QTableWidgetItem("0")
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(r, c, item)
+
+        # Initialize new cells (existing items survive the resize and keep
+        # their values; freshly exposed positions have no item yet)
+        with self._bulk_update():
+            item_at = self.table.item
+            set_item = self.table.setItem
+            align = Qt.AlignmentFlag.AlignCenter
+            for r in range(rows):
+                for c in range(cols):
+                    if item_at(r, c) is None:
+                        cell = QTableWidgetItem("0")
+                        cell.setTextAlignment(align)
+                        set_item(r, c, cell)
         
         # Resize dialog to fit new dimensions
         self._resize_to_fit_content()
@@ -199,68 +236,115 @@ class MatrixEditor(QDialog):
         self.cols_spin.setValue(cols)
         self.table.setRowCount(rows)
         self.table.setColumnCount(cols)
-        
-        for r in range(rows):
-            for c in range(cols):
-                item = QTableWidgetItem(f"{matrix[r, c]:.6g}")
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(r, c, item)
+
+        with self._bulk_update():
+            item_at = self.table.item
+            set_item = self.table.setItem
+            align = Qt.AlignmentFlag.AlignCenter
+            for r in range(rows):
+                for c in range(cols):
+                    cell = item_at(r, c)
+                    if cell is None:
+                        cell = QTableWidgetItem()
+                        cell.setTextAlignment(align)
+                        set_item(r, c, cell)
+                    cell.setText(f"{matrix[r, c]:.6g}")
     
     def _get_matrix_from_table(self) -> Optional[np.ndarray]:
         """Extract numpy array from table values."""
         rows = self.table.rowCount()
         cols = self.table.columnCount()
+
+        # Fast path: collect all cell texts in one pass and let NumPy parse
+        # them in C, instead of rows*cols Python-level float() calls.
+        item = self.table.item
+        texts = [
+            (item(r, c).text() or "0") if item(r, c) else "0"
+            for r in range(rows) for c in range(cols)
+        ]
+        try:
+            matrix = np.array(texts, dtype=np.float64).reshape(rows, cols)
+            # Freeze the matrix so downstream compute caches can key it by
+            # identity instead of hashing its bytes.
+            matrix.setflags(write=False)
+            return matrix
+        except ValueError:
+            pass  # Fall through to per-cell parsing to locate the bad cell
+
+        # Slow path: parse cell by cell so we can report the exact position
         matrix = np.zeros((rows, cols))
-        
         for r in range(rows):
             for c in range(cols):
-                item = self.table.item(r, c)
-                text = item.text() if item else "0"
+                text = texts[r * cols + c]
                 try:
-                    matrix[r, c] = float(text) if text else 0.0
+                    matrix[r, c] = float(text)
                 except ValueError:
                     QMessageBox.warning(
                         self, "Invalid Input",
                         f"Invalid number at row {r+1}, column {c+1}: '{text}'"
                     )
                     return None
-        
+
+        matrix.setflags(write=False)
         return matrix
     
     def _fill_identity(self) -> None:
         """Fill with identity matrix."""
         rows = self.rows_spin.value()
         cols = self.cols_spin.value()
-        
-        for r in range(rows):
-            for c in range(cols):
-                val = "1" if r == c else "0"
-                item = QTableWidgetItem(val)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(r, c, item)
+
+        # Build the string grid in one vectorized call
+        strs = np.where(np.eye(rows, cols, dtype=bool), "1", "0")
+        self._set_table_strings(strs)
     
     def _fill_zeros(self) -> None:
         """Fill with zeros."""
         rows = self.rows_spin.value()
         cols = self.cols_spin.value()
-        
-        for r in range(rows):
-            for c in range(cols):
-                item = QTableWidgetItem("0")
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(r, c, item)
+
+        zero = "0"
+        with self._bulk_update():
+            item_at = self.table.item
+            set_item = self.table.setItem
+            align = Qt.AlignmentFlag.AlignCenter
+            for r in range(rows):
+                for c in range(cols):
+                    cell = item_at(r, c)
+                    if cell is None:
+                        cell = QTableWidgetItem()
+                        cell.setTextAlignment(align)
+                        set_item(r, c, cell)
+                    cell.setText(zero)
     
     def _fill_random(self) -> None:
         """Fill with random values."""
         rows = self.rows_spin.value()
         cols = self.cols_spin.value()
         random_matrix = np.random.randn(rows, cols)
-        
-        for r in range(rows):
-            for c in range(cols):
-                item = QTableWidgetItem(f"{random_matrix[r, c]:.4f}")
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(r, c, item)
+
+        # Format every value in one C-level call instead of N*N f-strings
+        strs = np.char.mod("%.4f", random_matrix)
+        self._set_table_strings(strs)
+
+    def _set_table_strings(self, strs: np.ndarray) -> None:
+        """Populate the table from a 2D array of precomputed strings."""
+        rows, cols = strs.shape
+        # One bulk conversion to plain Python strings: iterating nested
+        # lists is cheaper than per-element ndarray indexing/unboxing
+        grid = strs.tolist()
+        with self._bulk_update():
+            item_at = self.table.item
+            set_item = self.table.setItem
+            align = Qt.AlignmentFlag.AlignCenter
+            for r in range(rows):
+                row = grid[r]
+                for c in range(cols):
+                    cell = item_at(r, c)
+                    if cell is None:
+                        cell = QTableWidgetItem()
+                        cell.setTextAlignment(align)
+                        set_item(r, c, cell)
+                    cell.setText(row[c])
     
     def _on_save(self) -> None:
         """Validate and save the matrix."""
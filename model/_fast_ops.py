@@ -0,0 +1,144 @@
+"""
+Optional Numba-compiled fast paths for small elementwise operations.
+
+For the tiny matrices typical of interactive use (3x3 .. 10x10), NumPy's
+ufunc dispatch overhead dominates the actual arithmetic. When Numba is
+installed these loops are compiled to tight LLVM code without that
+trampoline; without Numba the module degrades to plain NumPy and the
+Graph keeps using the standard ufuncs.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is an optional accelerator, not a requirement
+    njit = None
+    HAVE_NUMBA = False
+
+# Above this element count the jitted loop stops winning over NumPy's
+# vectorized kernels, so callers should fall back to the ufunc path.
+SMALL_SIZE_LIMIT = 1024
+
+
+def use_fast_path(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if the jitted elementwise kernels apply to this input pair."""
+    return (
+        HAVE_NUMBA
+        and a.shape == b.shape
+        and a.dtype == np.float64
+        and b.dtype == np.float64
+        and a.size < SMALL_SIZE_LIMIT
+    )
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def add(a, b):
+        out = np.empty_like(a)
+        for i in range(a.size):
+            out.flat[i] = a.flat[i] + b.flat[i]
+        return out
+
+    @njit(cache=True)
+    def subtract(a, b):
+        out = np.empty_like(a)
+        for i in range(a.size):
+            out.flat[i] = a.flat[i] - b.flat[i]
+        return out
+
+    @njit(cache=True)
+    def multiply(a, b):
+        out = np.empty_like(a)
+        for i in range(a.size):
+            out.flat[i] = a.flat[i] * b.flat[i]
+        return out
+
+    @njit(cache=True)
+    def divide(a, b):
+        out = np.empty_like(a)
+        for i in range(a.size):
+            out.flat[i] = a.flat[i] / b.flat[i]
+        return out
+
+    @njit(cache=True)
+    def reachable(indptr, indices, src, dst, visited, stack):
+        """
+        Depth-first reachability over a CSR adjacency (can src reach dst?).
+        visited and stack are caller-owned scratch arrays of length N;
+        visited must be zeroed before the call.
+        """
+        if src == dst:
+            return True
+        top = 0
+        stack[top] = src
+        top += 1
+        visited[src] = 1
+        while top > 0:
+            top -= 1
+            node = stack[top]
+            for i in range(indptr[node], indptr[node + 1]):
+                nxt = indices[i]
+                if nxt == dst:
+                    return True
+                if visited[nxt] == 0:
+                    visited[nxt] = 1
+                    stack[top] = nxt
+                    top += 1
+        return False
+
+    @njit(cache=True)
+    def sample_cubics(sources, targets, basis):
+        """
+        Sample the canvas wire cubics in one fused loop.
+
+        sources/targets are (N, 2) endpoint arrays, basis the (S, 4)
+        Bernstein matrix; control points follow the wire offset rule
+        (horizontal offset of max(|dx| / 2, 50)). Returns (N, S, 2).
+        """
+        n = sources.shape[0]
+        s = basis.shape[0]
+        out = np.empty((n, s, 2))
+        for i in range(n):
+            sx = sources[i, 0]
+            sy = sources[i, 1]
+            tx = targets[i, 0]
+            ty = targets[i, 1]
+            dx = tx - sx
+            if dx < 0.0:
+                dx = -dx
+            offset = dx * 0.5
+            if offset < 50.0:
+                offset = 50.0
+            c1x = sx + offset
+            c2x = tx - offset
+            for j in range(s):
+                b0 = basis[j, 0]
+                b1 = basis[j, 1]
+                b2 = basis[j, 2]
+                b3 = basis[j, 3]
+                out[i, j, 0] = b0 * sx + b1 * c1x + b2 * c2x + b3 * tx
+                out[i, j, 1] = (b0 + b1) * sy + (b2 + b3) * ty
+        return out
+
+    # Warm the compilation cache at import so the first real operation in
+    # the UI does not pay the JIT latency.
+    _warm = np.ones((2, 2))
+    add(_warm, _warm)
+    subtract(_warm, _warm)
+    multiply(_warm, _warm)
+    divide(_warm, _warm)
+    reachable(
+        np.array([0, 1, 1], dtype=np.int64), np.array([1], dtype=np.int64),
+        0, 1, np.zeros(2, dtype=np.uint8), np.zeros(2, dtype=np.int64),
+    )
+    sample_cubics(np.zeros((1, 2)), np.ones((1, 2)), np.ones((2, 4)))
+    del _warm
+else:
+    add = np.add
+    subtract = np.subtract
+    multiply = np.multiply
+    divide = np.divide
+    reachable = None
+    sample_cubics = None
@@ -5,9 +5,77 @@ from typing import Dict, List, Set, Optional
 from collections import deque
 import numpy as np
 
+from . import _fast_ops
 from .node_data import NodeData, NodeType, OperationType
 
 
+def _scalar1x1(value) -> np.ndarray:
+    """Box a scalar result as a 1x1 matrix without list parsing overhead.
+
+    Allocates in the value's own dtype: trace/determinant of a complex
+    matrix (anything downstream of EIGENVALUES) must keep its imaginary
+    part.
+    """
+    out = np.empty((1, 1), dtype=np.result_type(value))
+    out[0, 0] = value
+    return out
+
+
+def _lapack_ready(m: np.ndarray) -> np.ndarray:
+    """
+    Return a LAPACK-friendly layout for m. LAPACK accepts either C- or
+    F-contiguous input (so TRANSPOSE's F-ordered views pass through
+    untouched); only genuinely strided arrays get an explicit one-time
+    Fortran-order copy here instead of a hidden copy inside every call.
+    """
+    if m.flags.f_contiguous or m.flags.c_contiguous:
+        return m
+    return np.asfortranarray(m)
+
+
+def _det3(m: np.ndarray) -> float:
+    """Closed-form 3x3 determinant (cofactor expansion along row 0)."""
+    return (
+        m[0, 0] * (m[1, 1]*m[2, 2] - m[1, 2]*m[2, 1])
+        - m[0, 1] * (m[1, 0]*m[2, 2] - m[1, 2]*m[2, 0])
+        + m[0, 2] * (m[1, 0]*m[2, 1] - m[1, 1]*m[2, 0])
+    )
+
+
+def _inv_small(m: np.ndarray) -> np.ndarray:
+    """
+    Closed-form inverse for 2x2 / 3x3 float64 matrices; LAPACK overhead
+    dwarfs the handful of multiplies at these sizes.
+    """
+    if m.shape == (2, 2):
+        det = m[0, 0]*m[1, 1] - m[0, 1]*m[1, 0]
+        if det == 0.0:
+            raise np.linalg.LinAlgError("Singular matrix")
+        out = np.empty((2, 2))
+        inv_det = 1.0 / det
+        out[0, 0] = m[1, 1] * inv_det
+        out[0, 1] = -m[0, 1] * inv_det
+        out[1, 0] = -m[1, 0] * inv_det
+        out[1, 1] = m[0, 0] * inv_det
+        return out
+
+    det = _det3(m)
+    if det == 0.0:
+        raise np.linalg.LinAlgError("Singular matrix")
+    inv_det = 1.0 / det
+    out = np.empty((3, 3))
+    out[0, 0] = (m[1, 1]*m[2, 2] - m[1, 2]*m[2, 1]) * inv_det
+    out[0, 1] = (m[0, 2]*m[2, 1] - m[0, 1]*m[2, 2]) * inv_det
+    out[0, 2] = (m[0, 1]*m[1, 2] - m[0, 2]*m[1, 1]) * inv_det
+    out[1, 0] = (m[1, 2]*m[2, 0] - m[1, 0]*m[2, 2]) * inv_det
+    out[1, 1] = (m[0, 0]*m[2, 2] - m[0, 2]*m[2, 0]) * inv_det
+    out[1, 2] = (m[0, 2]*m[1, 0] - m[0, 0]*m[1, 2]) * inv_det
+    out[2, 0] = (m[1, 0]*m[2, 1] - m[1, 1]*m[2, 0]) * inv_det
+    out[2, 1] = (m[0, 1]*m[2, 0] - m[0, 0]*m[2, 1]) * inv_det
+    out[2, 2] = (m[0, 0]*m[1, 1] - m[0, 1]*m[1, 0]) * inv_det
+    return out
+
+
 class Graph:
     """
     Manages the computation graph as a DAG.
@@ -16,36 +84,59 @@ class Graph:
     
     def __init__(self):
         self.nodes: Dict[str, NodeData] = {}  # id -> NodeData
-        self.edges: Dict[str, List[str]] = {}  # source_id -> [target_ids]
-        self.reverse_edges: Dict[str, List[str]] = {}  # target_id -> [source_ids]
-    
+        self.edges: Dict[str, Set[str]] = {}  # source_id -> {target_ids}
+        self.reverse_edges: Dict[str, Set[str]] = {}  # target_id -> {source_ids}
+        # Topological level per node: every edge satisfies
+        # levels[source] < levels[target], so most connect calls can prove
+        # acyclicity without traversing the graph.
+        self.levels: Dict[str, int] = {}
+        # Bumped on every topology change; keys the downstream-order memo
+        # so repeated value-only propagations reuse the same order.
+        self._version = 0
+        self._topo_cache: Dict[str, tuple] = {}  # node_id -> (version, order)
+        # Reusable BFS scratch buffers; avoids reallocating a set and deque
+        # on every traversal in the interactive editing path.
+        self._scratch_visited: Set[str] = set()
+        self._scratch_queue: deque = deque()
+        self._scratch_in_use = False
+        # CSR snapshot of the adjacency for the Numba-compiled reachability
+        # kernel; rebuilt lazily when the topology version changes.
+        self._csr_version = -1
+        self._csr_indptr: Optional[np.ndarray] = None
+        self._csr_indices: Optional[np.ndarray] = None
+        self._csr_id_to_idx: Dict[str, int] = {}
+        self._csr_visited: Optional[np.ndarray] = None
+        self._csr_stack: Optional[np.ndarray] = None
+
     def add_node(self, node: NodeData) -> None:
         """Add a node to the graph."""
         self.nodes[node.id] = node
-        self.edges[node.id] = []
-        self.reverse_edges[node.id] = []
-    
+        self.edges[node.id] = set()
+        self.reverse_edges[node.id] = set()
+        self.levels[node.id] = 0
+        self._version += 1
+
     def remove_node(self, node_id: str) -> None:
         """Remove a node and all its connections."""
         if node_id not in self.nodes:
             return
-        
+
         # Remove all edges to/from this node
-        for target_id in self.edges.get(node_id, []):
+        for target_id in self.edges.get(node_id, ()):
             if target_id in self.reverse_edges:
-                self.reverse_edges[target_id] = [
-                    src for src in self.reverse_edges[target_id] if src != node_id
-                ]
-        
-        for source_id in self.reverse_edges.get(node_id, []):
+                self.reverse_edges[target_id].discard(node_id)
+
+        for source_id in self.reverse_edges.get(node_id, ()):
             if source_id in self.edges:
-                self.edges[source_id] = [
-                    tgt for tgt in self.edges[source_id] if tgt != node_id
-                ]
-        
+                self.edges[source_id].discard(node_id)
+
         del self.nodes[node_id]
         del self.edges[node_id]
         del self.reverse_edges[node_id]
+        # Remaining levels may stay conservatively high; that never breaks
+        # the levels[source] < levels[target] invariant for surviving edges.
+        del self.levels[node_id]
+        self._version += 1
     
     def connect(self, source_id: str, target_id: str, input_index: int) -> bool:
         """
@@ -55,15 +146,18 @@ class Graph:
         if source_id not in self.nodes or target_id not in self.nodes:
             return False
         
-        # Check for cycle
-        if self._would_create_cycle(source_id, target_id):
-            return False
-        
-        # Add edge
-        if target_id not in self.edges[source_id]:
-            self.edges[source_id].append(target_id)
-        if source_id not in self.reverse_edges[target_id]:
-            self.reverse_edges[target_id].append(source_id)
+        # Fast path: if the source already sits on a strictly lower level,
+        # the new edge respects the existing topological order and cannot
+        # close a cycle. Only when levels clash do we fall back to BFS.
+        if self.levels[source_id] >= self.levels[target_id]:
+            if self._would_create_cycle(source_id, target_id):
+                return False
+
+        # Add edge (set insertion deduplicates for free)
+        self.edges[source_id].add(target_id)
+        self.reverse_edges[target_id].add(source_id)
+        self._raise_levels(target_id)
+        self._version += 1
         
         # Update node input
         target_node = self.nodes[target_id]
@@ -74,66 +168,258 @@ class Graph:
     
     def disconnect(self, source_id: str, target_id: str, input_index: int) -> None:
         """Disconnect source from target's input."""
-        if source_id in self.edges and target_id in self.edges[source_id]:
-            self.edges[source_id].remove(target_id)
-        if target_id in self.reverse_edges and source_id in self.reverse_edges[target_id]:
-            self.reverse_edges[target_id].remove(source_id)
+        if source_id in self.edges:
+            self.edges[source_id].discard(target_id)
+        if target_id in self.reverse_edges:
+            self.reverse_edges[target_id].discard(source_id)
         
         if target_id in self.nodes:
             self.nodes[target_id].set_input(input_index, None)
+        self._version += 1
     
+    def _raise_levels(self, node_id: str) -> None:
+        """Lazily bump topological levels downstream of a changed node."""
+        levels = self.levels
+        queue = deque([node_id])
+        while queue:
+            current = queue.popleft()
+            level = max(
+                (levels[src] for src in self.reverse_edges.get(current, ())),
+                default=-1
+            ) + 1
+            if level > levels[current]:
+                levels[current] = level
+                queue.extend(self.edges.get(current, ()))
+
+    def _bfs_buffers(self) -> tuple:
+        """
+        Borrow the shared visited-set/queue scratch pair, falling back to
+        fresh buffers if a traversal is already running (reentrancy).
+        """
+        if self._scratch_in_use:
+            return set(), deque(), False
+        self._scratch_in_use = True
+        self._scratch_visited.clear()
+        self._scratch_queue.clear()
+        return self._scratch_visited, self._scratch_queue, True
+
+    def _ensure_csr(self) -> None:
+        """Rebuild the CSR adjacency snapshot if the topology changed."""
+        if self._csr_version == self._version:
+            return
+        id_to_idx = {nid: i for i, nid in enumerate(self.nodes)}
+        n = len(id_to_idx)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        for nid, targets in self.edges.items():
+            indptr[id_to_idx[nid] + 1] = len(targets)
+        np.cumsum(indptr, out=indptr)
+        indices = np.empty(indptr[-1], dtype=np.int64)
+        offsets = indptr[:-1].copy()
+        for nid, targets in self.edges.items():
+            i = id_to_idx[nid]
+            for tgt in targets:
+                indices[offsets[i]] = id_to_idx[tgt]
+                offsets[i] += 1
+        self._csr_id_to_idx = id_to_idx
+        self._csr_indptr = indptr
+        self._csr_indices = indices
+        self._csr_visited = np.zeros(n, dtype=np.uint8)
+        self._csr_stack = np.zeros(max(n, 1), dtype=np.int64)
+        self._csr_version = self._version
+
     def _would_create_cycle(self, source_id: str, target_id: str) -> bool:
         """Check if adding source->target edge would create a cycle."""
         # If target can reach source, adding source->target creates a cycle
-        visited: Set[str] = set()
-        queue = deque([target_id])
-        
-        while queue:
-            current = queue.popleft()
-            if current == source_id:
-                return True
-            if current in visited:
-                continue
-            visited.add(current)
-            queue.extend(self.edges.get(current, []))
-        
-        return False
-    
+        if _fast_ops.HAVE_NUMBA:
+            self._ensure_csr()
+            self._csr_visited[:] = 0
+            return bool(_fast_ops.reachable(
+                self._csr_indptr, self._csr_indices,
+                self._csr_id_to_idx[target_id], self._csr_id_to_idx[source_id],
+                self._csr_visited, self._csr_stack,
+            ))
+
+        visited, queue, borrowed = self._bfs_buffers()
+        queue.append(target_id)
+        try:
+            while queue:
+                current = queue.popleft()
+                if current == source_id:
+                    return True
+                if current in visited:
+                    continue
+                visited.add(current)
+                queue.extend(self.edges.get(current, ()))
+
+            return False
+        finally:
+            if borrowed:
+                self._scratch_in_use = False
+
     def get_downstream_nodes(self, node_id: str) -> List[str]:
         """Get all nodes downstream of the given node in topological order."""
         if node_id not in self.nodes:
             return []
-        
+
         downstream: List[str] = []
-        visited: Set[str] = set()
-        queue = deque(self.edges.get(node_id, []))
-        
+        visited, queue, borrowed = self._bfs_buffers()
+        queue.extend(self.edges.get(node_id, ()))
+        try:
+            while queue:
+                current = queue.popleft()
+                if current in visited:
+                    continue
+                visited.add(current)
+                downstream.append(current)
+                queue.extend(self.edges.get(current, ()))
+
+            return downstream
+        finally:
+            if borrowed:
+                self._scratch_in_use = False
+    
+    def _topo_downstream(self, node_id: str) -> List[str]:
+        """
+        Topological order of all nodes downstream of node_id (excluded).
+        Kahn's algorithm on the reachable subgraph, so every node is
+        computed exactly once and only after all its in-set parents.
+        Memoized until the topology changes.
+        """
+        cached = self._topo_cache.get(node_id)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        reachable = set(self.get_downstream_nodes(node_id))
+        # In-degree restricted to the reachable set plus the start node
+        indegree = {
+            nid: sum(1 for src in self.reverse_edges.get(nid, ())
+                     if src in reachable)
+            for nid in reachable
+        }
+        queue = deque(nid for nid in reachable if indegree[nid] == 0)
+        order: List[str] = []
+        seen: Set[str] = set()
         while queue:
             current = queue.popleft()
-            if current in visited:
+            if current in seen:
                 continue
-            visited.add(current)
-            downstream.append(current)
-            queue.extend(self.edges.get(current, []))
-        
-        return downstream
-    
+            seen.add(current)
+            order.append(current)
+            for nxt in self.edges.get(current, ()):
+                if nxt in reachable:
+                    indegree[nxt] -= 1
+                    if indegree[nxt] == 0:
+                        queue.append(nxt)
+
+        self._topo_cache = {node_id: (self._version, order)}
+        return order
+
     def propagate_from(self, node_id: str) -> None:
         """Recompute all nodes downstream of the given node."""
-        downstream = self.get_downstream_nodes(node_id)
-        
-        for nid in downstream:
+        order = self._topo_downstream(node_id)
+        observed = self._observed_set(order)
+        # Nodes whose observable value (or dirty state) actually changed;
+        # anything fed only by unchanged nodes is pruned from the walk.
+        changed: Set[str] = {node_id}
+        for nid in order:
+            node = self.nodes[nid]
+            parents = self.reverse_edges.get(nid, ())
+            # Fusable DOT intermediates are folded into their terminal's
+            # multi_dot call; nothing observes them, so skip the compute
+            # but keep the change signal flowing to the consumer.
+            if self._is_fusable_dot(node):
+                if node._dirty or not changed.isdisjoint(parents):
+                    changed.add(nid)
+                continue
+            if not node._dirty and changed.isdisjoint(parents):
+                continue
+            # Nodes feeding no observer just get flagged dirty; they are
+            # recomputed on demand via ensure_computed.
+            if nid not in observed:
+                node._dirty = True
+                changed.add(nid)
+                continue
+            if self._compute_node(node):
+                changed.add(nid)
+
+    def _observed_set(self, order: List[str]) -> Set[str]:
+        """
+        Subset of `order` that is observed: has change callbacks itself or
+        feeds (transitively) a node that does. Walks the topological order
+        backwards, so one pass suffices.
+        """
+        observed: Set[str] = set()
+        for nid in reversed(order):
             node = self.nodes[nid]
-            self._compute_node(node)
+            if node._on_change_callbacks or any(
+                tgt in observed for tgt in self.edges.get(nid, ())
+            ):
+                observed.add(nid)
+        return observed
+
+    def ensure_computed(self, node_id: str) -> None:
+        """Recompute a node (and any dirty dependencies) on demand."""
+        node = self.nodes.get(node_id)
+        if node is not None and node._dirty:
+            self._ensure_clean(node)
+
+    def _ensure_clean(self, node: NodeData) -> None:
+        """Recursively recompute dirty upstream nodes, then this one."""
+        for inp in node._inputs:
+            if inp is not None and inp._dirty:
+                self._ensure_clean(inp)
+        node._dirty = False
+        self._compute_node(node)
+
+    def _is_fusable_dot(self, node: NodeData) -> bool:
+        """
+        True if this DOT node can be folded into a downstream DOT chain:
+        its single consumer is another DOT node and nobody observes its
+        intermediate result (no UI callbacks), so materializing it would
+        be wasted work.
+        """
+        if node.operation != OperationType.DOT or node._on_change_callbacks:
+            return False
+        targets = self.edges.get(node.id, ())
+        if len(targets) != 1:
+            return False
+        consumer = self.nodes.get(next(iter(targets)))
+        return consumer is not None and consumer.operation == OperationType.DOT
+
+    def _flatten_dot_inputs(self, node: NodeData) -> List[Optional[NodeData]]:
+        """Flatten a DOT chain into its leaf factors, left to right."""
+        leaves: List[Optional[NodeData]] = []
+        for inp in node._inputs:
+            if inp is not None and self._is_fusable_dot(inp):
+                leaves.extend(self._flatten_dot_inputs(inp))
+            else:
+                leaves.append(inp)
+        return leaves
     
-    def _compute_node(self, node: NodeData) -> None:
-        """Compute the result for an operation node."""
+    def _compute_node(self, node: NodeData) -> bool:
+        """
+        Compute the result for an operation node. Returns True if the
+        node's observable state changed (and listeners were notified);
+        False lets propagate_from prune the walk past this node.
+        """
         if node.node_type == NodeType.DATA:
             # Data nodes don't compute, they just hold input
-            return
+            return False
         
-        # Gather inputs
-        inputs = [node.get_input(i) for i in range(node.input_count)]
+        # Gather inputs (direct list access; bounds are fixed by input_count).
+        # DOT chains are flattened to their leaf factors so the whole chain
+        # is evaluated with one optimally-parenthesized multi_dot.
+        if node.operation == OperationType.DOT:
+            inputs = self._flatten_dot_inputs(node)
+        else:
+            inputs = node._inputs[:node._input_count]
+
+        node._dirty = False
+        # Inputs skipped by an earlier lazy propagation must be brought up
+        # to date before we read their matrices.
+        for inp in inputs:
+            if inp is not None and inp._dirty:
+                self._ensure_clean(inp)
         
         # Check if all required inputs are connected and have data
         matrices = []
@@ -142,24 +428,37 @@ class Graph:
                 node.error_state = "Missing input"
                 node.matrix = None
                 node.notify_change()
-                return
+                return True
             if inp.matrix is None:
                 node.error_state = "Input has no data"
                 node.matrix = None
                 node.notify_change()
-                return
+                return True
             if inp.error_state:
                 node.error_state = "Input has error"
                 node.matrix = None
                 node.notify_change()
-                return
+                return True
             matrices.append(inp.matrix)
-        
+
+        # Skip recompute if the exact same inputs already produced the
+        # current result. Read-only arrays are keyed by identity (cheap);
+        # writeable ones by content hash.
+        key = (node.operation, tuple(
+            hash(m.tobytes()) if m.flags.writeable else id(m)
+            for m in matrices
+        ))
+        if key == node._cache_key and node.error_state is None:
+            return False
+
         # Perform the operation
+        prev = node.matrix
         try:
             result = self._execute_operation(node.operation, matrices)
             node.matrix = result
             node.error_state = None
+            node._cache_key = key
+            node._cache_inputs = matrices
         except np.linalg.LinAlgError as e:
             node.error_state = f"LinAlg Error: {e}"
             node.matrix = None
@@ -169,54 +468,94 @@ class Graph:
         except Exception as e:
             node.error_state = f"Error: {e}"
             node.matrix = None
-        
+
+        if node.error_state is not None:
+            node._cache_key = None
+            node._cache_inputs = []
+        elif prev is not None and prev.shape == node.matrix.shape \
+                and np.array_equal(prev, node.matrix):
+            # Recompute landed on the identical value (e.g. a no-op edit):
+            # skip the listener fan-out and let the caller prune downstream.
+            return False
+
         node.notify_change()
+        return True
     
     def _execute_operation(self, op: OperationType, matrices: List[np.ndarray]) -> np.ndarray:
         """Execute a matrix operation."""
         if op == OperationType.RESULT:
-            return matrices[0].copy()
+            # Display-only terminal node: a read-only view is enough, no
+            # need to duplicate the whole buffer every propagation.
+            view = matrices[0].view()
+            view.setflags(write=False)
+            return view
         
-        # Binary operations
+        # Binary operations. For small same-shape float64 pairs the jitted
+        # kernels skip NumPy's ufunc dispatch overhead (no-op without Numba).
         if op == OperationType.ADD:
+            if _fast_ops.use_fast_path(matrices[0], matrices[1]):
+                return _fast_ops.add(matrices[0], matrices[1])
             return np.add(matrices[0], matrices[1])
         elif op == OperationType.SUBTRACT:
+            if _fast_ops.use_fast_path(matrices[0], matrices[1]):
+                return _fast_ops.subtract(matrices[0], matrices[1])
             return np.subtract(matrices[0], matrices[1])
         elif op == OperationType.MULTIPLY_SCALAR:
             return np.multiply(matrices[0], matrices[1])
         elif op == OperationType.MULTIPLY_ELEMENTWISE:
+            if _fast_ops.use_fast_path(matrices[0], matrices[1]):
+                return _fast_ops.multiply(matrices[0], matrices[1])
             return np.multiply(matrices[0], matrices[1])
         elif op == OperationType.DIVIDE_ELEMENTWISE:
+            if _fast_ops.use_fast_path(matrices[0], matrices[1]):
+                return _fast_ops.divide(matrices[0], matrices[1])
             return np.divide(matrices[0], matrices[1])
         elif op == OperationType.DOT:
+            if len(matrices) > 2:
+                # Fused chain: multi_dot picks the cheapest parenthesization
+                return np.linalg.multi_dot(matrices)
             return np.dot(matrices[0], matrices[1])
         elif op == OperationType.CROSS:
             return np.cross(matrices[0], matrices[1])
         elif op == OperationType.SOLVE:
-            return np.linalg.solve(matrices[0], matrices[1])
+            return np.linalg.solve(_lapack_ready(matrices[0]),
+                                   _lapack_ready(matrices[1]))
         
         # Unary operations
         elif op == OperationType.TRANSPOSE:
             return matrices[0].T
         elif op == OperationType.DETERMINANT:
-            return np.array([[np.linalg.det(matrices[0])]])
+            m = matrices[0]
+            # Closed forms for the common tiny cases skip the LAPACK call
+            if m.dtype == np.float64:
+                if m.shape == (2, 2):
+                    return _scalar1x1(m[0, 0]*m[1, 1] - m[0, 1]*m[1, 0])
+                if m.shape == (3, 3):
+                    return _scalar1x1(_det3(m))
+            # slogdet costs the same LU factorization as det but is stable
+            # against overflow for large matrices
+            sign, logdet = np.linalg.slogdet(m)
+            return _scalar1x1(sign * np.exp(logdet))
         elif op == OperationType.TRACE:
-            return np.array([[np.trace(matrices[0])]])
+            return _scalar1x1(np.trace(matrices[0]))
         elif op == OperationType.RANK:
-            return np.array([[np.linalg.matrix_rank(matrices[0])]])
+            return _scalar1x1(np.linalg.matrix_rank(matrices[0]))
         elif op == OperationType.INVERSE:
-            return np.linalg.inv(matrices[0])
+            m = matrices[0]
+            if m.dtype == np.float64 and m.shape in ((2, 2), (3, 3)):
+                return _inv_small(m)
+            return np.linalg.inv(_lapack_ready(m))
         elif op == OperationType.PSEUDO_INVERSE:
-            return np.linalg.pinv(matrices[0])
+            return np.linalg.pinv(_lapack_ready(matrices[0]))
         elif op == OperationType.EIGENVALUES:
-            eigenvalues, _ = np.linalg.eig(matrices[0])
-            return eigenvalues.reshape(-1, 1)
+            # eigvals skips the eigenvector backsolve that eig would discard
+            return np.linalg.eigvals(_lapack_ready(matrices[0])).reshape(-1, 1)
         elif op == OperationType.EIGENVECTORS:
-            _, eigenvectors = np.linalg.eig(matrices[0])
+            _, eigenvectors = np.linalg.eig(_lapack_ready(matrices[0]))
             return eigenvectors
         elif op == OperationType.SVD:
             # Return singular values as column vector
-            _, s, _ = np.linalg.svd(matrices[0])
+            _, s, _ = np.linalg.svd(_lapack_ready(matrices[0]))
             return s.reshape(-1, 1)
         
         raise ValueError(f"Unknown operation: {op}")
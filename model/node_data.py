@@ -1,11 +1,19 @@
 """
 NodeData: Core data structure for nodes in the computation graph.
 """
-import uuid
+import random
 from enum import Enum
+from itertools import count as _count
 from typing import Optional, List, Callable
 import numpy as np
 
+# In-process node IDs only need to be unique, not cryptographically random.
+# A monotonic counter avoids the urandom read + 128-bit formatting that
+# uuid4 pays per node; the per-session prefix keeps IDs from colliding
+# across sessions if graphs are ever persisted.
+_session_prefix = f"{random.getrandbits(24):06x}"
+_next_id = _count()
+
 
 class NodeType(Enum):
     """Types of nodes in the graph."""
@@ -81,19 +89,29 @@ class NodeData:
         operation: OperationType = OperationType.NONE,
         matrix: Optional[np.ndarray] = None
     ):
-        self.id = str(uuid.uuid4())
+        self.id = f"{_session_prefix}-{next(_next_id)}"
         self.name = name
         self.node_type = node_type
         self.operation = operation
         self.matrix = matrix  # The actual data or computed result
         self.error_state: Optional[str] = None
-        self._inputs: List[Optional['NodeData']] = [None] * OPERATION_INPUTS.get(operation, 0)
+        # Cached once: the operation never changes after construction
+        self._input_count = OPERATION_INPUTS.get(operation, 0)
+        self._inputs: List[Optional['NodeData']] = [None] * self._input_count
         self._on_change_callbacks: List[Callable] = []
-    
+        # Compute memoization (managed by Graph._compute_node): the key of
+        # the inputs that produced the current matrix, plus strong refs to
+        # those inputs so id()-based key entries stay valid.
+        self._cache_key: Optional[tuple] = None
+        self._cache_inputs: List[np.ndarray] = []
+        # Set by Graph when a propagation skipped this node because nothing
+        # observes it; cleared when it is (re)computed on demand.
+        self._dirty = False
+
     @property
     def input_count(self) -> int:
         """Number of inputs this node expects."""
-        return OPERATION_INPUTS.get(self.operation, 0)
+        return self._input_count
     
     @property
     def shape_str(self) -> str:
@@ -117,7 +135,7 @@ class NodeData:
     
     def clear_inputs(self) -> None:
         """Clear all input connections."""
-        self._inputs = [None] * self.input_count
+        self._inputs = [None] * self._input_count
     
     def add_change_callback(self, callback: Callable) -> None:
         """Register a callback for when data changes."""
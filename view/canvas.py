@@ -1,22 +1,25 @@
 """
 Canvas: The main workbench with infinite grid, panning, and zooming.
 """
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
 from PySide6.QtWidgets import (
     QGraphicsView, QGraphicsScene, QWidget
 )
-from PySide6.QtCore import Qt, QPointF, Signal, QRectF
-from PySide6.QtGui import QPainter, QColor, QPen, QWheelEvent, QMouseEvent
+from PySide6.QtCore import Qt, QPointF, QTimer, Signal, QRectF
+from PySide6.QtGui import (
+    QPainter, QColor, QPen, QBrush, QPixmap, QWheelEvent, QMouseEvent
+)
 
 from model.node_data import NodeData, NodeType, OperationType
 from model.graph import Graph
-from view.node_item import NodeItem
+from view.node_item import NodeItem, SOCKET_RADIUS
 from view.wire_item import WireItem
 
 
 # Canvas colors per UI_UX_Design.md
 CANVAS_BG = QColor("#F5F7FA")
 GRID_COLOR = QColor("#E1E4E8")
+GRID_PEN = QPen(GRID_COLOR, 1)
 GRID_SIZE = 20
 
 
@@ -27,29 +30,65 @@ class CanvasScene(QGraphicsScene):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setBackgroundBrush(CANVAS_BG)
-    
-    def drawBackground(self, painter: QPainter, rect: QRectF) -> None:
-        """Draw grid lines."""
-        super().drawBackground(painter, rect)
-        
-        painter.setPen(QPen(GRID_COLOR, 0.5))
-        
-        # Calculate grid bounds
-        left = int(rect.left()) - (int(rect.left()) % GRID_SIZE)
-        top = int(rect.top()) - (int(rect.top()) % GRID_SIZE)
-        
-        # Draw vertical lines
-        x = left
-        while x < rect.right():
-            painter.drawLine(x, int(rect.top()), x, int(rect.bottom()))
-            x += GRID_SIZE
-        
-        # Draw horizontal lines
-        y = top
-        while y < rect.bottom():
-            painter.drawLine(int(rect.left()), y, int(rect.right()), y)
-            y += GRID_SIZE
+        # The grid is one cell rendered once into a pixmap and set as a
+        # tiled background brush: Qt repeats the tile natively, so no
+        # Python code runs per paint event at all.
+        self._grid_step = 0
+        self._grid_tiles: Dict[int, QBrush] = {}
+        self.set_grid_step(GRID_SIZE)
+        # Wire currently under the cursor; hover is dispatched from here
+        # with one indexed query per mouse move instead of Qt hit-testing
+        # every hover-accepting wire
+        self._hovered_wire: Optional[WireItem] = None
+
+    def release_hover(self, wire: WireItem) -> None:
+        """Forget a wire that is about to leave the scene."""
+        if self._hovered_wire is wire:
+            self._hovered_wire = None
+
+    def mouseMoveEvent(self, event) -> None:
+        """Dispatch wire hover from the scene's spatial index."""
+        hits = self.items(event.scenePos())
+        top = hits[0] if hits else None
+        wire = top if isinstance(top, WireItem) else None
+        if wire is not self._hovered_wire:
+            if self._hovered_wire is not None:
+                self._hovered_wire._set_hovered(False)
+            if wire is not None:
+                wire._set_hovered(True)
+            self._hovered_wire = wire
+        super().mouseMoveEvent(event)
+
+    def set_grid_step(self, step: int) -> None:
+        """
+        Switch the background to a grid with the given cell spacing, or a
+        flat fill when step is 0 (zoomed out past any visible grid).
+        Tiles are cached per step, so flipping LOD levels is a brush swap.
+        """
+        if step == self._grid_step:
+            return
+        self._grid_step = step
+        if step == 0:
+            self.setBackgroundBrush(QBrush(CANVAS_BG))
+            return
+        brush = self._grid_tiles.get(step)
+        if brush is None:
+            brush = QBrush(self._make_grid_tile(step))
+            self._grid_tiles[step] = brush
+        self.setBackgroundBrush(brush)
+
+    @staticmethod
+    def _make_grid_tile(step: int) -> QPixmap:
+        """Render a single step x step grid cell."""
+        tile = QPixmap(step, step)
+        tile.fill(CANVAS_BG)
+        painter = QPainter(tile)
+        painter.setPen(GRID_PEN)
+        # Right and bottom edges; tiling supplies the other two sides
+        painter.drawLine(step - 1, 0, step - 1, step - 1)
+        painter.drawLine(0, step - 1, step - 1, step - 1)
+        painter.end()
+        return tile
 
 
 class CanvasView(QGraphicsView):
@@ -70,16 +109,53 @@ class CanvasView(QGraphicsView):
         # Node and wire tracking
         self._node_items: Dict[str, NodeItem] = {}
         self._wire_items: Dict[Tuple[str, str, int], WireItem] = {}
+        # Adjacency index: node_id -> keys of wires touching it, so drag
+        # updates cost O(degree) instead of scanning every wire
+        self._wires_by_node: Dict[str, Set[Tuple[str, str, int]]] = {}
         
         # Interaction state
         self._panning = False
         self._pan_start = QPointF()
         self._temp_wire: Optional[WireItem] = None
         self._connecting_from: Optional[Tuple[str, int]] = None  # (node_id, socket_index)
+        # Source socket position for the drag in progress; the source node
+        # can't move while its socket is being dragged, so compute it once
+        self._temp_wire_source_pos: Optional[QPointF] = None
+
+        # Zoom coalescing: high-resolution wheels fire dozens of events per
+        # gesture; accumulate the factor and apply one scale per ~frame
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(8)
+        self._zoom_timer.timeout.connect(self._flush_zoom)
         
-        # View settings
+        # GPU compositing: with an OpenGL viewport the tiled grid brush and
+        # cached item pixmaps are blitted by the GPU instead of the raster
+        # engine. Optional — the raster path stays fully functional. The
+        # import alone does not prove GL works (offscreen platforms and
+        # some remote sessions import fine but can't paint), so only
+        # install the viewport once a context actually comes up.
+        try:
+            from PySide6.QtGui import QOpenGLContext
+            from PySide6.QtOpenGLWidgets import QOpenGLWidget
+            context = QOpenGLContext()
+            if context.create():
+                self.setViewport(QOpenGLWidget())
+        except ImportError:
+            pass
+
+        # View settings. Antialiasing is set here once for the whole
+        # scene; items must not toggle it per paint.
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Minimal updates: only regions dirtied by moved/changed items are
+        # repainted. Safe because nodes have a fixed boundingRect and move
+        # via setPos, and wires change geometry through setPath — both of
+        # which invalidate their old region for us.
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        # Items fully set up their own painter state, so the save/restore
+        # bracket Qt wraps around every item's paint() is wasted work
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
@@ -93,13 +169,13 @@ class CanvasView(QGraphicsView):
         # Add to graph model
         self.graph.add_node(node_data)
         
-        # Create visual item
+        # Create visual item (sets up its own raster cache and shadow)
         node_item = NodeItem(node_data)
         if pos:
             node_item.setPos(pos)
         
-        # Connect signals
-        node_item.signals.position_changed.connect(self._on_node_moved)
+        # Connect signals (moves update adjacent wires directly via
+        # NodeItem.itemChange, not through a per-pixel signal)
         node_item.signals.connection_started.connect(self._on_connection_started)
         
         # Add to scene
@@ -111,12 +187,8 @@ class CanvasView(QGraphicsView):
     def remove_node(self, node_id: str) -> None:
         """Remove a node from the canvas."""
         if node_id in self._node_items:
-            # Remove connected wires first
-            wires_to_remove = [
-                key for key in self._wire_items 
-                if key[0] == node_id or key[1] == node_id
-            ]
-            for key in wires_to_remove:
+            # Remove connected wires first (copy: _remove_wire mutates the index)
+            for key in list(self._wires_by_node.get(node_id, ())):
                 self._remove_wire(key)
             
             # Remove node item
@@ -138,6 +210,16 @@ class CanvasView(QGraphicsView):
         wire = WireItem()
         key = (source_id, target_id, input_index)
         self._wire_items[key] = wire
+        self._wires_by_node.setdefault(source_id, set()).add(key)
+        self._wires_by_node.setdefault(target_id, set()).add(key)
+
+        # Wire observes its endpoint nodes; node moves push geometry into
+        # it directly from itemChange
+        source_item = self._node_items[source_id]
+        target_item = self._node_items[target_id]
+        wire.attach(source_item, target_item, input_index)
+        source_item.add_adjacent_wire(wire)
+        target_item.add_adjacent_wire(wire)
         self._scene.addItem(wire)
         
         # Update wire positions
@@ -174,20 +256,24 @@ class CanvasView(QGraphicsView):
         """Remove a wire."""
         if key in self._wire_items:
             wire = self._wire_items.pop(key)
+            self._scene.release_hover(wire)
+            for item in (wire.source_item, wire.target_item):
+                if item is not None:
+                    item.remove_adjacent_wire(wire)
+            for node_id in (key[0], key[1]):
+                keys = self._wires_by_node.get(node_id)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._wires_by_node[node_id]
             self._scene.removeItem(wire)
             self.graph.disconnect(key[0], key[1], key[2])
     
-    def _on_node_moved(self, node_id: str) -> None:
-        """Handle node position change - update connected wires."""
-        # Update all wires connected to this node
-        for key in self._wire_items:
-            if key[0] == node_id or key[1] == node_id:
-                self._update_wire(key)
-    
     def _on_connection_started(self, node_id: str, socket_index: int, scene_pos: QPointF) -> None:
         """Start drawing a temporary wire."""
         self._connecting_from = (node_id, socket_index)
-        
+        self._temp_wire_source_pos = scene_pos
+
         # Create temporary wire
         self._temp_wire = WireItem()
         self._temp_wire.set_positions(scene_pos, scene_pos)
@@ -206,8 +292,28 @@ class CanvasView(QGraphicsView):
         factor = 1.15
         if event.angleDelta().y() < 0:
             factor = 1 / factor
-        
-        self.scale(factor, factor)
+
+        self._pending_zoom *= factor
+        self._zoom_timer.start()
+
+    def _flush_zoom(self) -> None:
+        """Apply the accumulated zoom factor in one transform update."""
+        if self._pending_zoom != 1.0:
+            self.scale(self._pending_zoom, self._pending_zoom)
+            self._pending_zoom = 1.0
+            self._update_grid_lod()
+
+    def _update_grid_lod(self) -> None:
+        """
+        Keep grid cells at least ~4 device pixels apart by doubling the
+        spacing as the view zooms out; far enough out the grid is invisible
+        mush, so drop it entirely.
+        """
+        zoom = self.transform().m11()
+        step = GRID_SIZE
+        while zoom * step < 4:
+            step *= 2
+        self._scene.set_grid_step(0 if step > GRID_SIZE * 64 else step)
     
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Handle mouse press for panning."""
@@ -230,15 +336,12 @@ class CanvasView(QGraphicsView):
                 int(self.verticalScrollBar().value() - delta.y())
             )
         elif self._temp_wire and self._connecting_from:
-            # Update temp wire endpoint
-            scene_pos = self.mapToScene(event.pos())
-            source_id, _ = self._connecting_from
-            source_item = self._node_items.get(source_id)
-            if source_item:
-                self._temp_wire.set_positions(
-                    source_item.get_output_socket_scene_pos(),
-                    scene_pos
-                )
+            # Update temp wire endpoint; the source end is fixed for the
+            # whole drag, so only the cursor end moves
+            self._temp_wire.set_positions(
+                self._temp_wire_source_pos,
+                self.mapToScene(event.pos())
+            )
         else:
             super().mouseMoveEvent(event)
     
@@ -253,9 +356,11 @@ class CanvasView(QGraphicsView):
             self._try_complete_connection(scene_pos)
             
             # Remove temp wire
+            self._scene.release_hover(self._temp_wire)
             self._scene.removeItem(self._temp_wire)
             self._temp_wire = None
             self._connecting_from = None
+            self._temp_wire_source_pos = None
         else:
             super().mouseReleaseEvent(event)
     
@@ -265,13 +370,21 @@ class CanvasView(QGraphicsView):
             return
         
         source_id, _ = self._connecting_from
-        
-        # Find if we're over an input socket
-        for node_id, node_item in self._node_items.items():
+
+        # Query the scene's spatial index for items near the drop point
+        # instead of hit-testing every node on the canvas. The query rect
+        # covers the socket hit tolerance so near-miss drops still land.
+        reach = SOCKET_RADIUS * 3
+        hit_area = QRectF(scene_pos.x() - reach, scene_pos.y() - reach,
+                          reach * 2, reach * 2)
+        for item in self._scene.items(hit_area):
+            if not isinstance(item, NodeItem):
+                continue
+            node_id = item.node_data.id
             if node_id == source_id:
                 continue  # Can't connect to self
-            
-            socket_index = node_item.get_clicked_input_socket(scene_pos)
+
+            socket_index = item.get_clicked_input_socket(scene_pos)
             if socket_index >= 0:
                 # Try to make connection
                 self.connect_nodes(source_id, node_id, socket_index)
@@ -1,19 +1,62 @@
 """
 Inspector: The right panel (Zone C) for detailed data viewing.
 """
+import io
 from typing import Optional
 import numpy as np
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QLabel, QTableView,
     QPushButton, QHBoxLayout, QApplication
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont, QFontMetrics
 
 from model.node_data import NodeData, NodeType, OperationType
 
 
+# Above this element count resizeColumnsToContents (which measures every
+# row) is replaced by a fixed column width.
+RESIZE_TO_CONTENTS_LIMIT = 10_000
+
+
+class MatrixModel(QAbstractTableModel):
+    """
+    Read-only table model over a numpy array.
+    Cells are formatted on demand, so only the visible viewport is ever
+    materialized — no per-cell item objects for the whole matrix.
+    """
+
+    def __init__(self, matrix: np.ndarray, parent=None):
+        super().__init__(parent)
+        if matrix.ndim == 0:
+            matrix = matrix.reshape(1, 1)
+        elif matrix.ndim == 1:
+            matrix = matrix.reshape(-1, 1)
+        self._matrix = matrix
+        self._complex = np.iscomplexobj(matrix)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._matrix.shape[0]
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._matrix.shape[1]
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            val = self._matrix[index.row(), index.column()]
+            # Format complex numbers if needed
+            if self._complex:
+                return f"{val:.4g}" if val.imag else f"{val.real:.6g}"
+            return f"{val:.6g}"
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
 class Inspector(QWidget):
     """
     Right panel that shows detailed matrix data for selected nodes.
@@ -21,7 +64,16 @@ class Inspector(QWidget):
     """
     
     add_matrix_requested = Signal(object)  # Emits NodeData for adding as variable
-    
+
+    # Built once: per-selection restyling would re-allocate these on every click
+    _HEADER_FONT = QFont("Segoe UI", 12, QFont.Weight.Bold)
+    _INFO_FMT = (
+        "<b>{name}</b><br>"
+        "Type: {type}<br>"
+        "Shape: {shape}<br>"
+        "{err}"
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumWidth(280)
@@ -38,7 +90,7 @@ class Inspector(QWidget):
         
         # Header
         self.header_label = QLabel("Inspector")
-        self.header_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.header_label.setFont(self._HEADER_FONT)
         self.header_label.setStyleSheet("color: #1976D2; padding: 4px;")
         layout.addWidget(self.header_label)
         
@@ -56,16 +108,17 @@ class Inspector(QWidget):
         """)
         layout.addWidget(self.info_label)
         
-        # Data table (hidden initially)
-        self.table = QTableWidget()
+        # Data table (hidden initially); cells come lazily from MatrixModel
+        self.table = QTableView()
+        self._model: Optional[MatrixModel] = None
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 1px solid #E0E0E0;
                 border-radius: 6px;
                 background: white;
                 gridline-color: #F0F0F0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
                 color: #333;
             }
@@ -145,15 +198,16 @@ class Inspector(QWidget):
             self._show_empty_state()
             return
         
-        # Update info label
-        info_text = f"<b>{node.name}</b><br>"
-        info_text += f"Type: {node.node_type.value.title()}<br>"
-        info_text += f"Shape: {node.shape_str}<br>"
-        
+        # Update info label (single template render, no string concat chain)
+        err = ""
         if node.error_state:
-            info_text += f"<span style='color: red;'>Error: {node.error_state}</span>"
-        
-        self.info_label.setText(info_text)
+            err = f"<span style='color: red;'>Error: {node.error_state}</span>"
+        self.info_label.setText(self._INFO_FMT.format(
+            name=node.name,
+            type=node.node_type.value.title(),
+            shape=node.shape_str,
+            err=err,
+        ))
         
         # Update table
         if node.matrix is not None:
@@ -172,38 +226,18 @@ class Inspector(QWidget):
     
     def _display_matrix(self, matrix: np.ndarray) -> None:
         """Display a numpy array in the table."""
-        if matrix.ndim == 0:
-            # Scalar
-            self.table.setRowCount(1)
-            self.table.setColumnCount(1)
-            item = QTableWidgetItem(f"{float(matrix):.6g}")
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(0, 0, item)
-            return
-        
-        if matrix.ndim == 1:
-            matrix = matrix.reshape(-1, 1)
-        
-        rows, cols = matrix.shape
-        self.table.setRowCount(rows)
-        self.table.setColumnCount(cols)
-        
-        for r in range(rows):
-            for c in range(cols):
-                val = matrix[r, c]
-                # Format complex numbers if needed
-                if np.iscomplex(val):
-                    text = f"{val:.4g}"
-                else:
-                    text = f"{float(val.real):.6g}"
-                
-                item = QTableWidgetItem(text)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Read-only
-                self.table.setItem(r, c, item)
-        
-        # Resize columns to content
-        self.table.resizeColumnsToContents()
+        self._model = MatrixModel(matrix)
+        self.table.setModel(self._model)
+
+        # resizeColumnsToContents measures every row; on big matrices a
+        # fixed width keeps selection O(1) instead of O(rows*cols)
+        if matrix.size <= RESIZE_TO_CONTENTS_LIMIT:
+            self.table.resizeColumnsToContents()
+        else:
+            # Width of a worst-case %.6g rendering plus item padding
+            metrics = QFontMetrics(self.table.font())
+            width = metrics.horizontalAdvance("-1.23456e+08") + 16
+            self.table.horizontalHeader().setDefaultSectionSize(width)
     
     def _copy_to_clipboard(self) -> None:
         """Copy matrix data to clipboard."""
@@ -213,17 +247,21 @@ class Inspector(QWidget):
         matrix = self._current_node.matrix
         if matrix.ndim == 1:
             matrix = matrix.reshape(-1, 1)
-        
-        # Format as tab-separated values
-        lines = []
-        for r in range(matrix.shape[0]):
-            row_vals = []
-            for c in range(matrix.shape[1] if matrix.ndim > 1 else 1):
-                val = matrix[r, c] if matrix.ndim > 1 else matrix[r]
-                row_vals.append(f"{val:.6g}")
-            lines.append("\t".join(row_vals))
-        
-        text = "\n".join(lines)
+
+        matrix = np.atleast_2d(matrix)
+        if np.iscomplexobj(matrix):
+            # savetxt wraps complex cells in parentheses, which breaks
+            # pasting into spreadsheets; keep per-cell :.6g for those
+            text = "\n".join(
+                "\t".join(f"{value:.6g}" for value in row) for row in matrix
+            )
+        else:
+            # Format as tab-separated values; savetxt runs the %.6g
+            # formatting in C over the whole array instead of one
+            # f-string per cell
+            buf = io.StringIO()
+            np.savetxt(buf, matrix, fmt="%.6g", delimiter="\t")
+            text = buf.getvalue().rstrip("\n")
         QApplication.clipboard().setText(text)
     
     def refresh(self) -> None:
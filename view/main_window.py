@@ -10,7 +10,7 @@ from PySide6.QtGui import QDragEnterEvent, QDropEvent
 from model.node_data import NodeData, NodeType, OperationType
 from model.graph import Graph
 from view.canvas import CanvasView
-from view.sidebar import Sidebar
+from view.sidebar import Sidebar, DraggableListWidget, DRAG_MIME_TYPE
 from view.inspector import Inspector
 from dialogs.matrix_editor import MatrixEditor
 
@@ -187,28 +187,51 @@ class MainWindow(QMainWindow):
                 return True
             elif event.type() == event.Type.DragMove:
                 # Must accept DragMove for Drop to work
-                if event.mimeData().hasText():
-                    text = event.mimeData().text()
-                    if text.startswith("MATRIX:") or text.startswith("OPERATION:"):
-                        event.acceptProposedAction()
+                if self._mime_is_node(event.mimeData()):
+                    event.acceptProposedAction()
                 return True
             elif event.type() == event.Type.Drop:
                 self._handle_drop(event)
                 return True
         return super().eventFilter(obj, event)
     
+    @staticmethod
+    def _mime_is_node(mime: QMimeData) -> bool:
+        """True if the MIME data carries a droppable node payload."""
+        if mime.hasFormat(DRAG_MIME_TYPE):
+            return True
+        if mime.hasText():
+            text = mime.text()
+            return text.startswith("MATRIX:") or text.startswith("OPERATION:")
+        return False
+
     def _handle_drag_enter(self, event: QDragEnterEvent) -> None:
         """Accept drag if valid MIME data."""
-        if event.mimeData().hasText():
-            text = event.mimeData().text()
-            if text.startswith("MATRIX:") or text.startswith("OPERATION:"):
-                event.acceptProposedAction()
-    
+        if self._mime_is_node(event.mimeData()):
+            event.acceptProposedAction()
+
     def _handle_drop(self, event: QDropEvent) -> None:
         """Handle drop on canvas."""
-        text = event.mimeData().text()
         pos = self.canvas.mapToScene(event.position().toPoint())
-        
+
+        # In-process drag: read the payload straight back, no string parse.
+        # The MIME format itself survives across processes, so a missing
+        # payload means the drag came from another instance — fall through
+        # to the text parsing below in that case.
+        if event.mimeData().hasFormat(DRAG_MIME_TYPE):
+            payload = DraggableListWidget._drag_payload
+            if isinstance(payload, tuple):
+                op_type, display_name = payload
+                self._add_operation_node_to_canvas(op_type.value, display_name, pos)
+                event.acceptProposedAction()
+                return
+            if payload:
+                self._add_matrix_node_to_canvas(payload, pos)
+                event.acceptProposedAction()
+                return
+
+        text = event.mimeData().text()
+
         if text.startswith("MATRIX:"):
             # Drop a matrix node
             matrix_id = text.split(":", 1)[1]
@@ -230,14 +253,16 @@ class MainWindow(QMainWindow):
         if not source_node:
             return
         
-        # Create a new node that references the source matrix
-        node = NodeData(
-            source_node.name,
-            NodeType.DATA,
-            OperationType.NONE,
-            source_node.matrix.copy() if source_node.matrix is not None else None
-        )
-        
+        # Share the source buffer through a read-only view instead of
+        # copying on every drop; compute never mutates its inputs, and the
+        # write=False flag also lets the graph cache key the array by
+        # identity.
+        matrix = None
+        if source_node.matrix is not None:
+            matrix = source_node.matrix.view()
+            matrix.setflags(write=False)
+
+        node = NodeData(source_node.name, NodeType.DATA, OperationType.NONE, matrix)
         self.canvas.add_node(node, pos)
     
     def _add_operation_node_to_canvas(self, op_value: str, display_name: str, pos: QPointF) -> None:
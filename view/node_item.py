@@ -2,10 +2,13 @@
 NodeItem: Custom QGraphicsItem for visual nodes on the canvas.
 """
 from PySide6.QtWidgets import QGraphicsItem, QGraphicsDropShadowEffect, QStyleOptionGraphicsItem, QWidget
-from PySide6.QtCore import Qt, QRectF, QPointF, Signal, QObject
+from PySide6.QtCore import Qt, QRectF, QPointF, Signal, QObject, QTimer
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPainterPath
 
+import numpy as np
+
 from model.node_data import NodeData, NodeType, OperationType
+from view.wire_item import sample_wire_curves
 
 
 # Color constants per UI_UX_Design.md
@@ -26,11 +29,61 @@ HEADER_HEIGHT = 28
 SOCKET_RADIUS = 6
 CORNER_RADIUS = 8
 
+# Node geometry is identical for every node, so the rounded-rect paths
+# are tessellated once here instead of per paint call
+_BODY_PATH = QPainterPath()
+_BODY_PATH.addRoundedRect(0, 0, NODE_WIDTH, NODE_HEIGHT, CORNER_RADIUS, CORNER_RADIUS)
+
+_HEADER_PATH = QPainterPath()
+_HEADER_PATH.addRoundedRect(0, 0, NODE_WIDTH, HEADER_HEIGHT, CORNER_RADIUS, CORNER_RADIUS)
+# Clip bottom corners of header
+_HEADER_PATH.addRect(0, HEADER_HEIGHT - CORNER_RADIUS, NODE_WIDTH, CORNER_RADIUS)
+
+# Fixed-geometry rects, built once: boundingRect feeds the scene's BSP
+# maintenance and culling, which call it far more often than paint does
+_SHADOW_MARGIN = 10
+_BOUNDING_RECT = QRectF(-_SHADOW_MARGIN, -_SHADOW_MARGIN,
+                        NODE_WIDTH + 2 * _SHADOW_MARGIN,
+                        NODE_HEIGHT + 2 * _SHADOW_MARGIN)
+_HEADER_TEXT_RECT = QRectF(8, 4, NODE_WIDTH - 16, HEADER_HEIGHT - 4)
+_BODY_TEXT_RECT = QRectF(8, HEADER_HEIGHT + 4, NODE_WIDTH - 16,
+                         NODE_HEIGHT - HEADER_HEIGHT - 8)
+_OUTPUT_SOCKET_POS = QPointF(NODE_WIDTH, NODE_HEIGHT / 2)
+
+# Input socket Y offsets for the common input counts, folded at import
+# time; nodes in this app have at most a handful of inputs
+_INPUT_Y_TABLE: dict = {
+    n: tuple(
+        HEADER_HEIGHT + (NODE_HEIGHT - HEADER_HEIGHT) / (n + 1) * (i + 1)
+        for i in range(n)
+    )
+    for n in range(6)
+}
+
+
+def _within(px: float, py: float, sx: float, sy: float, r: float) -> bool:
+    """True if (px, py) lies inside the circle of radius r at (sx, sy).
+
+    Squared-distance on raw floats: no QPointF temporaries, and a proper
+    circular hit region (manhattanLength favors axis-aligned hits).
+    """
+    dx = px - sx
+    dy = py - sy
+    return dx * dx + dy * dy < r * r
+
+# Shared fonts and pens: QFont construction hits the font database and
+# every QPen is a refcounted alloc — none of that belongs in paint()
+_HEADER_FONT = QFont("Segoe UI", 10, QFont.Weight.Bold)
+_BODY_FONT = QFont("Segoe UI", 9)
+_BORDER_PEN_NORMAL = QPen(COLORS['border'], 1)
+_BORDER_PEN_ERROR = QPen(COLORS['error'], 1)
+_BORDER_PEN_SELECTED = QPen(QColor("#2196F3"), 2)  # Blue selection
+_SOCKET_PEN = QPen(COLORS['socket'].darker(120), 1)
+
 
 class NodeSignals(QObject):
     """Signals for NodeItem."""
     selected = Signal(object)  # Emits NodeData
-    position_changed = Signal(str)  # Emits node_id
     connection_started = Signal(str, int, QPointF)  # node_id, socket_index, scene_pos
     connection_dropped = Signal(str, int, QPointF)  # node_id, socket_index, scene_pos
 
@@ -49,25 +102,87 @@ class NodeItem(QGraphicsItem):
         # Make item interactive
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
-        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
+        # ItemSendsGeometryChanges stays off until a wire attaches (see
+        # add_adjacent_wire); itemChange only exists to keep wires in
+        # sync, and the flag costs a Python roundtrip on every position
+        # change. It must track wires, not mouse grabs: a multi-select
+        # drag moves nodes that never see the mouse events.
         self.setAcceptHoverEvents(True)
+
+        # Rasterize once and blit on pan/zoom; state transitions call
+        # update(), which invalidates just this item's cached pixmap
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+        # Drop shadow composited by Qt rather than hand-painted per repaint
+        self._shadow = QGraphicsDropShadowEffect()
+        self._shadow.setBlurRadius(8)
+        self._shadow.setOffset(2, 2)
+        self._shadow.setColor(QColor(0, 0, 0, 40))
+        self.setGraphicsEffect(self._shadow)
         
         # Visual state
         self._hovered = False
         self._dragging_socket = -1  # Which output socket is being dragged (-1 = none)
+
+        # Wires touching this node; updated directly from itemChange so a
+        # move costs O(degree) plain calls with no signal round-trip
+        self._adjacent_wires: list = []
+
+        # Coalesce wire updates during drags to one per frame; a 240Hz
+        # mouse would otherwise recompute every wire path per event.
+        # Parented to self.signals (QTimer needs a QObject owner).
+        self._wire_timer = QTimer(self.signals)
+        self._wire_timer.setSingleShot(True)
+        self._wire_timer.setInterval(16)
+        self._wire_timer.timeout.connect(self._flush_wire_updates)
+
+        # Socket layout cache (fixed while input_count is)
+        self._socket_spacing = 0.0
+        self._input_socket_ys: tuple = ()
+        self._recompute_socket_layout()
         
+        # Strings paint() draws, refreshed only when the data changes
+        self._display_name = ""
+        self._display_shape = ""
+        self._refresh_display_strings()
+
         # Subscribe to data changes
         self.node_data.add_change_callback(self._on_data_changed)
     
     def _on_data_changed(self, node: NodeData) -> None:
         """Handle data changes from the model."""
+        if len(self._input_socket_ys) != node.input_count:
+            self._recompute_socket_layout()
+        self._refresh_display_strings()
         self.update()
+
+    def _refresh_display_strings(self) -> None:
+        """Re-derive the cached header/body strings from the node data."""
+        self._display_name = self.node_data.name[:18]  # Truncate long names
+        self._display_shape = (
+            "Error" if self.node_data.error_state else self.node_data.shape_str
+        )
+
+    def _recompute_socket_layout(self) -> None:
+        """Precompute input socket Y offsets for paint and hit tests."""
+        count = self.node_data.input_count
+        if count == 0:
+            self._socket_spacing = 0.0
+            self._input_socket_ys = ()
+            self._input_socket_points = ()
+            return
+        self._socket_spacing = (NODE_HEIGHT - HEADER_HEIGHT) / (count + 1)
+        ys = _INPUT_Y_TABLE.get(count)
+        if ys is None:
+            ys = tuple(
+                HEADER_HEIGHT + self._socket_spacing * (i + 1) for i in range(count)
+            )
+        self._input_socket_ys = ys
+        self._input_socket_points = tuple(QPointF(0, y) for y in ys)
     
     def boundingRect(self) -> QRectF:
-        """Define the bounding box for the item."""
-        # Add margin for shadow
-        margin = 10
-        return QRectF(-margin, -margin, NODE_WIDTH + 2*margin, NODE_HEIGHT + 2*margin)
+        """Define the bounding box for the item (margin covers the shadow)."""
+        return _BOUNDING_RECT
     
     def _get_header_color(self) -> QColor:
         """Get header color based on node type."""
@@ -82,54 +197,42 @@ class NodeItem(QGraphicsItem):
     
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget = None) -> None:
         """Draw the node."""
+        # Nothing of this node is actually exposed (offscreen or fully
+        # covered): skip all painter setup
+        if option.exposedRect.isEmpty():
+            return
+
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Shadow effect (simple manual shadow)
-        shadow_offset = 4 if self._hovered else 2
-        shadow_path = QPainterPath()
-        shadow_path.addRoundedRect(shadow_offset, shadow_offset, NODE_WIDTH, NODE_HEIGHT, CORNER_RADIUS, CORNER_RADIUS)
-        painter.fillPath(shadow_path, QColor(0, 0, 0, 40))
-        
+
         # Main body
-        body_rect = QRectF(0, 0, NODE_WIDTH, NODE_HEIGHT)
-        body_path = QPainterPath()
-        body_path.addRoundedRect(body_rect, CORNER_RADIUS, CORNER_RADIUS)
-        
-        # Fill body
-        painter.fillPath(body_path, COLORS['body'])
-        
+        painter.fillPath(_BODY_PATH, COLORS['body'])
+
         # Header
-        header_path = QPainterPath()
-        header_path.addRoundedRect(0, 0, NODE_WIDTH, HEADER_HEIGHT, CORNER_RADIUS, CORNER_RADIUS)
-        # Clip bottom corners of header
-        header_path.addRect(0, HEADER_HEIGHT - CORNER_RADIUS, NODE_WIDTH, CORNER_RADIUS)
-        painter.fillPath(header_path, self._get_header_color())
+        painter.fillPath(_HEADER_PATH, self._get_header_color())
         
-        # Border
-        border_color = COLORS['error'] if self.node_data.error_state else COLORS['border']
+        # Border: drawRoundedRect hits the raster backend's primitive
+        # fast path instead of stroking a tessellated path
         if self.isSelected():
-            border_color = QColor("#2196F3")  # Blue selection
-        pen = QPen(border_color, 2 if self.isSelected() else 1)
-        painter.setPen(pen)
-        painter.drawPath(body_path)
-        
+            painter.setPen(_BORDER_PEN_SELECTED)
+        elif self.node_data.error_state:
+            painter.setPen(_BORDER_PEN_ERROR)
+        else:
+            painter.setPen(_BORDER_PEN_NORMAL)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(0, 0, NODE_WIDTH, NODE_HEIGHT, CORNER_RADIUS, CORNER_RADIUS)
+
         # Header text (node name)
         painter.setPen(COLORS['text'])
-        font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(QRectF(8, 4, NODE_WIDTH - 16, HEADER_HEIGHT - 4), 
+        painter.setFont(_HEADER_FONT)
+        painter.drawText(_HEADER_TEXT_RECT,
                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                        self.node_data.name[:18])  # Truncate long names
-        
+                        self._display_name)
+
         # Body text (shape info)
-        font = QFont("Segoe UI", 9)
-        painter.setFont(font)
-        body_text = self.node_data.shape_str
-        if self.node_data.error_state:
-            body_text = "Error"
-        painter.drawText(QRectF(8, HEADER_HEIGHT + 4, NODE_WIDTH - 16, NODE_HEIGHT - HEADER_HEIGHT - 8),
+        painter.setFont(_BODY_FONT)
+        painter.drawText(_BODY_TEXT_RECT,
                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
-                        body_text)
+                        self._display_shape)
         
         # Draw sockets
         self._draw_sockets(painter)
@@ -137,11 +240,10 @@ class NodeItem(QGraphicsItem):
     def _draw_sockets(self, painter: QPainter) -> None:
         """Draw input and output sockets."""
         painter.setBrush(COLORS['socket'])
-        painter.setPen(QPen(COLORS['socket'].darker(120), 1))
+        painter.setPen(_SOCKET_PEN)
         
         # Input sockets (left side)
-        for i in range(self.node_data.input_count):
-            pos = self.get_input_socket_pos(i)
+        for pos in self._input_socket_points:
             painter.drawEllipse(pos, SOCKET_RADIUS, SOCKET_RADIUS)
         
         # Output socket (right side) - all nodes except RESULT type have output
@@ -154,16 +256,13 @@ class NodeItem(QGraphicsItem):
     
     def get_input_socket_pos(self, index: int) -> QPointF:
         """Get scene position of input socket at index."""
-        count = self.node_data.input_count
-        if count == 0:
+        if not self._input_socket_points:
             return QPointF(0, NODE_HEIGHT / 2)
-        spacing = (NODE_HEIGHT - HEADER_HEIGHT) / (count + 1)
-        y = HEADER_HEIGHT + spacing * (index + 1)
-        return QPointF(0, y)
-    
+        return self._input_socket_points[index]
+
     def get_output_socket_pos(self) -> QPointF:
         """Get scene position of output socket."""
-        return QPointF(NODE_WIDTH, NODE_HEIGHT / 2)
+        return _OUTPUT_SOCKET_POS
     
     def get_input_socket_scene_pos(self, index: int) -> QPointF:
         """Get scene position of input socket."""
@@ -176,19 +275,67 @@ class NodeItem(QGraphicsItem):
     def hoverEnterEvent(self, event) -> None:
         """Handle mouse hover enter."""
         self._hovered = True
-        self.update()
+        # Lift the shadow instead of repainting: the effect recomposites
+        # without invalidating the item's cached pixmap
+        self._shadow.setOffset(4, 4)
         super().hoverEnterEvent(event)
-    
+
     def hoverLeaveEvent(self, event) -> None:
         """Handle mouse hover leave."""
         self._hovered = False
-        self.update()
+        self._shadow.setOffset(2, 2)
         super().hoverLeaveEvent(event)
     
+    def add_adjacent_wire(self, wire) -> None:
+        """Register a wire to be updated when this node moves."""
+        if wire not in self._adjacent_wires:
+            self._adjacent_wires.append(wire)
+            self.setFlag(
+                QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True
+            )
+
+    def remove_adjacent_wire(self, wire) -> None:
+        """Unregister a wire from move updates."""
+        if wire in self._adjacent_wires:
+            self._adjacent_wires.remove(wire)
+            if not self._adjacent_wires:
+                self.setFlag(
+                    QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, False
+                )
+
+    def _flush_wire_updates(self) -> None:
+        """Push the current geometry into every attached wire."""
+        wires = [
+            w for w in self._adjacent_wires
+            if w.source_item is not None and w.target_item is not None
+        ]
+        if len(wires) < 2:
+            for wire in wires:
+                wire.update_from_items()
+            return
+        # Several wires moved together: sample all their curves with one
+        # Bernstein matmul instead of per-wire path construction
+        count = len(wires)
+        sources = np.empty((count, 2))
+        targets = np.empty((count, 2))
+        endpoints = []
+        for i, wire in enumerate(wires):
+            source = wire.source_item.get_output_socket_scene_pos()
+            target = wire.target_item.get_input_socket_scene_pos(wire.input_index)
+            sources[i, 0] = source.x()
+            sources[i, 1] = source.y()
+            targets[i, 0] = target.x()
+            targets[i, 1] = target.y()
+            endpoints.append((source, target))
+        curves = sample_wire_curves(sources, targets)
+        for wire, (source, target), points in zip(wires, endpoints, curves):
+            wire.apply_curve(source, target, points)
+
     def itemChange(self, change, value):
         """Handle item changes."""
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
-            self.signals.position_changed.emit(self.node_data.id)
+            if not self._wire_timer.isActive():
+                self._wire_timer.start()
         elif change == QGraphicsItem.GraphicsItemChange.ItemSelectedHasChanged:
             if value:
                 self.signals.selected.emit(self.node_data)
@@ -200,8 +347,7 @@ class NodeItem(QGraphicsItem):
         
         # Check output socket
         if self.node_data.node_type != NodeType.RESULT:
-            output_pos = self.get_output_socket_pos()
-            if (pos - output_pos).manhattanLength() < SOCKET_RADIUS * 2:
+            if _within(pos.x(), pos.y(), NODE_WIDTH, NODE_HEIGHT * 0.5, SOCKET_RADIUS * 2):
                 self._dragging_socket = 0  # Output socket
                 self.signals.connection_started.emit(
                     self.node_data.id, 
@@ -209,20 +355,29 @@ class NodeItem(QGraphicsItem):
                     self.get_output_socket_scene_pos()
                 )
                 return
-        
+
         super().mousePressEvent(event)
-    
+
     def mouseReleaseEvent(self, event) -> None:
         """Handle mouse release."""
         if self._dragging_socket >= 0:
             self._dragging_socket = -1
+        # Don't leave wires a frame behind the drop position
+        if self._wire_timer.isActive():
+            self._wire_timer.stop()
+        self._flush_wire_updates()
         super().mouseReleaseEvent(event)
     
     def get_clicked_input_socket(self, scene_pos: QPointF) -> int:
         """Check if scene position is over an input socket. Returns socket index or -1."""
+        ys = self._input_socket_ys
+        if not ys:
+            return -1
         local_pos = self.mapFromScene(scene_pos)
-        for i in range(self.node_data.input_count):
-            socket_pos = self.get_input_socket_pos(i)
-            if (local_pos - socket_pos).manhattanLength() < SOCKET_RADIUS * 3:
-                return i
+        # Invert the layout formula to get the nearest candidate socket,
+        # then distance-test only that one — O(1) instead of a scan
+        idx = round((local_pos.y() - HEADER_HEIGHT) / self._socket_spacing) - 1
+        idx = min(max(idx, 0), len(ys) - 1)
+        if _within(local_pos.x(), local_pos.y(), 0, ys[idx], SOCKET_RADIUS * 3):
+            return idx
         return -1
@@ -4,8 +4,8 @@ Sidebar: The Variable Shelf (Zone A) - inventory of matrices and operations.
 from typing import Dict, Callable, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QFrame, QScrollArea, QSizePolicy,
-    QTreeWidget, QTreeWidgetItem
+    QListWidget, QListWidgetItem, QListView, QFrame, QScrollArea,
+    QSizePolicy, QTreeWidget, QTreeWidgetItem
 )
 from PySide6.QtCore import Qt, Signal, QMimeData
 from PySide6.QtGui import QDrag, QFont
@@ -48,56 +48,127 @@ OPERATIONS = {
 }
 
 
+# Shared fonts: built once instead of per item / per Sidebar instance
+_SECTION_FONT = QFont("Segoe UI", 12, QFont.Weight.Bold)
+_CATEGORY_FONT = QFont("Segoe UI", 10, QFont.Weight.Bold)
+_OP_FONT = QFont("Segoe UI", 9)
+
+
+# Role holding a category's not-yet-built operation list
+_PENDING_OPS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def _populate_operations_tree(tree: QTreeWidget) -> None:
+    """Fill the static operation catalog into a tree in one batched pass.
+
+    Only the category rows are built here; their children are created on
+    first expand so rarely-opened categories cost nothing.
+    """
+    tree.setUpdatesEnabled(False)
+    try:
+        for category, operations in OPERATIONS.items():
+            # Create category item (parent); Qt's native branch indicator
+            # shows the expanded/collapsed state
+            category_item = QTreeWidgetItem([category])
+            category_item.setFont(0, _CATEGORY_FONT)
+            category_item.setForeground(0, Qt.GlobalColor.darkBlue)
+            category_item.setFirstColumnSpanned(True)
+            # Show the expand indicator even though no children exist yet
+            category_item.setChildIndicatorPolicy(
+                QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+            )
+            category_item.setData(0, _PENDING_OPS_ROLE, operations)
+            tree.addTopLevelItem(category_item)
+    finally:
+        tree.setUpdatesEnabled(True)
+    tree.itemExpanded.connect(_materialize_category)
+
+
+def _materialize_category(item: QTreeWidgetItem) -> None:
+    """Build a category's operation rows the first time it is expanded."""
+    operations = item.data(0, _PENDING_OPS_ROLE)
+    if not operations or item.childCount():
+        return
+    item.setData(0, _PENDING_OPS_ROLE, None)
+    for op_type, display_name in operations:
+        child_item = QTreeWidgetItem([f"  {display_name}"])
+        child_item.setData(0, Qt.ItemDataRole.UserRole, (op_type, display_name))
+        child_item.setFont(0, _OP_FONT)
+        item.addChild(child_item)
+
+
+# Sentinel MIME type for in-process drags. Qt re-queries MIME data
+# repeatedly while the cursor moves, so the payload (matrix id string or
+# (OperationType, display_name) tuple) is parked on DraggableListWidget
+# and read back directly by the drop handler; the text form is still set
+# as a fallback for cross-process drops.
+DRAG_MIME_TYPE = "application/x-matrixlab-node"
+
+
 class DraggableListWidget(QListWidget):
     """List widget that supports drag operations."""
-    
+
+    # Payload of the drag currently in flight (shared with the tree widget)
+    _drag_payload = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setDragEnabled(True)
         self.setDragDropMode(QListWidget.DragDropMode.DragOnly)
-    
+        # Every row is one line of text: measure once and lay out in
+        # batches so inserts stay O(1) with many variables
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(64)
+
     def startDrag(self, supportedActions):
         """Custom drag with MIME data."""
         item = self.currentItem()
         if item:
             drag = QDrag(self)
             mime_data = QMimeData()
-            
+
             # Store item data in MIME
             data = item.data(Qt.ItemDataRole.UserRole)
             if data:
+                DraggableListWidget._drag_payload = data
+                mime_data.setData(DRAG_MIME_TYPE, b"")
                 if isinstance(data, tuple):
                     mime_data.setText(f"OPERATION:{data[0].value}:{data[1]}")
                 else:
                     mime_data.setText(f"MATRIX:{data}")
-            
+
             drag.setMimeData(mime_data)
             drag.exec(Qt.DropAction.CopyAction)
+            DraggableListWidget._drag_payload = None
 
 
 class DraggableTreeWidget(QTreeWidget):
     """Tree widget that supports drag operations for operation nodes."""
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setDragEnabled(True)
         self.setDragDropMode(QTreeWidget.DragDropMode.DragOnly)
         self.setHeaderHidden(True)
-    
+
     def startDrag(self, supportedActions):
         """Custom drag with MIME data."""
         item = self.currentItem()
         if item and item.parent():  # Only allow dragging child items (operations), not categories
             drag = QDrag(self)
             mime_data = QMimeData()
-            
+
             # Store item data in MIME
             data = item.data(0, Qt.ItemDataRole.UserRole)
             if data and isinstance(data, tuple):
+                DraggableListWidget._drag_payload = data
+                mime_data.setData(DRAG_MIME_TYPE, b"")
                 mime_data.setText(f"OPERATION:{data[0].value}:{data[1]}")
-            
+
             drag.setMimeData(mime_data)
             drag.exec(Qt.DropAction.CopyAction)
+            DraggableListWidget._drag_payload = None
 
 
 class Sidebar(QWidget):
@@ -120,7 +191,9 @@ class Sidebar(QWidget):
         self.setMinimumWidth(250)
         self.setMaximumWidth(300)
         
-        self._matrix_items: Dict[str, QListWidgetItem] = {}
+        # node_id -> (row, item); tracking the row ourselves avoids Qt's
+        # O(n) row() scan on every removal
+        self._matrix_items: Dict[str, tuple] = {}
         
         self._setup_ui()
     
@@ -131,7 +204,7 @@ class Sidebar(QWidget):
         
         # ===== VARIABLES SECTION =====
         header = QLabel("Variables")
-        header.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        header.setFont(_SECTION_FONT)
         layout.addWidget(header)
         
         # New Matrix button
@@ -195,7 +268,7 @@ class Sidebar(QWidget):
         
         # ===== OPERATIONS SECTION =====
         ops_header = QLabel("Operations")
-        ops_header.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        ops_header.setFont(_SECTION_FONT)
         layout.addWidget(ops_header)
         
         # Operations tree (collapsible categories)
@@ -226,73 +299,60 @@ class Sidebar(QWidget):
             QTreeWidget::branch {
                 background: transparent;
             }
-            QTreeWidget::branch:has-children:closed {
-                image: url(none);
-                border: none;
-            }
-            QTreeWidget::branch:has-children:open {
-                image: url(none);
-                border: none;
-            }
         """)
         
+        # All rows share the item padding from the stylesheet, so Qt can
+        # skip per-row height measurement
+        self.operations_tree.setUniformRowHeights(True)
+
         # Populate tree with operation categories
-        for category, operations in OPERATIONS.items():
-            # Create category item (parent) with arrow only
-            category_item = QTreeWidgetItem([f"▶ {category}"])  # Start with down arrow (expanded)
-            category_item.setFont(0, QFont("Segoe UI", 10, QFont.Weight.Bold))
-            category_item.setForeground(0, Qt.GlobalColor.darkBlue)
-            category_item.setExpanded(True)  # Start expanded
-            
-            # Add operations as children with subtle indentation
-            for op_type, display_name in operations:
-                child_item = QTreeWidgetItem([f"  {display_name}"])
-                child_item.setData(0, Qt.ItemDataRole.UserRole, (op_type, display_name))
-                child_item.setFont(0, QFont("Segoe UI", 9))
-                category_item.addChild(child_item)
-            
-            self.operations_tree.addTopLevelItem(category_item)
-        
-        # Connect expand/collapse signals to update arrows
-        self.operations_tree.itemExpanded.connect(self._on_item_expanded)
-        self.operations_tree.itemCollapsed.connect(self._on_item_collapsed)
-        
+        _populate_operations_tree(self.operations_tree)
+
         layout.addWidget(self.operations_tree, 1)
-    
-    def _on_item_expanded(self, item: QTreeWidgetItem) -> None:
-        """Update arrow when item is expanded."""
-        text = item.text(0)
-        if text.startswith("▶"):
-            # Replace right arrow with down arrow
-            new_text = "▼" + text[1:]
-            item.setText(0, new_text)
-    
-    def _on_item_collapsed(self, item: QTreeWidgetItem) -> None:
-        """Update arrow when item is collapsed."""
-        text = item.text(0)
-        if text.startswith("▼"):
-            # Replace down arrow with right arrow
-            new_text = "▶" + text[1:]
-            item.setText(0, new_text)
-    
+
+    def begin_bulk_update(self) -> None:
+        """Suspend list repaints while a batch of mutations runs."""
+        self.matrix_list.setUpdatesEnabled(False)
+
+    def end_bulk_update(self) -> None:
+        """Re-enable repaints; the list lays out once for the whole batch."""
+        self.matrix_list.setUpdatesEnabled(True)
+
     def add_matrix(self, node_id: str, name: str, shape: str) -> None:
         """Add a matrix to the variable list."""
         item = QListWidgetItem(f"{name} [{shape}]")
         item.setData(Qt.ItemDataRole.UserRole, node_id)
+        self._matrix_items[node_id] = (self.matrix_list.count(), item)
         self.matrix_list.addItem(item)
-        self._matrix_items[node_id] = item
+
+    def add_matrices(self, entries) -> None:
+        """
+        Add many matrices at once (e.g. project restore), collapsing the
+        per-item relayout into a single one.
+        Each entry is a (node_id, name, shape) tuple.
+        """
+        self.begin_bulk_update()
+        try:
+            for node_id, name, shape in entries:
+                self.add_matrix(node_id, name, shape)
+        finally:
+            self.end_bulk_update()
     
     def remove_matrix(self, node_id: str) -> None:
         """Remove a matrix from the variable list."""
         if node_id in self._matrix_items:
-            item = self._matrix_items.pop(node_id)
-            row = self.matrix_list.row(item)
+            row, _item = self._matrix_items.pop(node_id)
             self.matrix_list.takeItem(row)
-    
+            # Items after the removed row shift up by one
+            self._matrix_items = {
+                nid: (r - 1 if r > row else r, itm)
+                for nid, (r, itm) in self._matrix_items.items()
+            }
+
     def update_matrix(self, node_id: str, name: str, shape: str) -> None:
         """Update matrix display in list."""
         if node_id in self._matrix_items:
-            self._matrix_items[node_id].setText(f"{name} [{shape}]")
+            self._matrix_items[node_id][1].setText(f"{name} [{shape}]")
     
     def _on_matrix_clicked(self, item: QListWidgetItem) -> None:
         """Handle single-click on matrix item to show preview in Inspector."""
@@ -2,14 +2,73 @@
 WireItem: Cubic Bezier curve connecting node sockets.
 """
 from PySide6.QtWidgets import QGraphicsPathItem
-from PySide6.QtCore import QPointF
-from PySide6.QtGui import QPainter, QColor, QPen, QPainterPath
+import numpy as np
+from PySide6.QtCore import QPointF, Qt, QTimer
+from PySide6.QtGui import (
+    QPainter, QColor, QPen, QPainterPath, QPainterPathStroker, QPolygonF,
+    QTransform,
+)
 
+from model import _fast_ops
 
-# Wire colors per UI_UX_Design.md
-WIRE_COLOR = QColor("#546E7A")      # Slate Grey
-WIRE_ERROR_COLOR = QColor("#F44336") # Red
-WIRE_HOVER_COLOR = QColor("#78909C") # Lighter slate
+
+# Wire colors per UI_UX_Design.md; integer ctors skip the hex-string
+# parse at import
+WIRE_COLOR = QColor(0x54, 0x6E, 0x7A)           # Slate Grey
+WIRE_ERROR_COLOR = QColor(0xF4, 0x43, 0x36)     # Red
+WIRE_HOVER_COLOR = QColor(0x78, 0x90, 0x9C)     # Lighter slate
+WIRE_SELECTED_COLOR = QColor(0x21, 0x96, 0xF3)  # Blue
+
+
+def _wire_pen(color: QColor, width: int) -> QPen:
+    pen = QPen(color, width)
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+    return pen
+
+
+# Newer PySide6 builds ship NumPy-aware QPainter methods that skip the
+# per-point marshaling of QPolygonF; use them when present (6.6 has not
+# got them yet, so this usually falls back to drawPolyline)
+_HAS_DRAW_POLYLINE_NP = hasattr(QPainter, "drawPolylineNp")
+
+# Bernstein basis for sampling the cubic at fixed parameter values,
+# built once; sampling N wires is then a single matmul
+_N_SAMPLES = 24
+_t = np.linspace(0.0, 1.0, _N_SAMPLES)
+_BERNSTEIN = np.stack(
+    [(1 - _t) ** 3, 3 * (1 - _t) ** 2 * _t, 3 * (1 - _t) * _t ** 2, _t ** 3],
+    axis=1,
+)
+del _t
+
+
+def sample_wire_curves(sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Sample every wire's cubic in one shot.
+
+    sources/targets are (N, 2) endpoint arrays; the control points use
+    the same offset rule as WireItem._update_path. Returns an
+    (N, _N_SAMPLES, 2) array of curve points.
+    """
+    if _fast_ops.HAVE_NUMBA:
+        # Jitted kernel fuses the offset rule and the basis product into
+        # one loop with no intermediate arrays
+        return _fast_ops.sample_cubics(sources, targets, _BERNSTEIN)
+    dx = np.abs(targets[:, 0] - sources[:, 0])
+    offset = np.maximum(dx * 0.5, 50.0)
+    ctrl1 = sources.copy()
+    ctrl1[:, 0] += offset
+    ctrl2 = targets.copy()
+    ctrl2[:, 0] -= offset
+    control_points = np.stack([sources, ctrl1, ctrl2, targets], axis=1)
+    return _BERNSTEIN @ control_points
+
+
+# One pen per visual state, built once; paint() just selects one
+_PEN_NORMAL = _wire_pen(WIRE_COLOR, 2)
+_PEN_HOVER = _wire_pen(WIRE_HOVER_COLOR, 3)
+_PEN_ERROR = _wire_pen(WIRE_ERROR_COLOR, 2)
+_PEN_SELECTED = _wire_pen(WIRE_SELECTED_COLOR, 4)
 
 
 class WireItem(QGraphicsPathItem):
@@ -19,79 +78,239 @@ class WireItem(QGraphicsPathItem):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        
+
         self.source_pos = QPointF(0, 0)
         self.target_pos = QPointF(100, 100)
         self.is_error = False
         self._hovered = False
+
+        # Endpoint node items (set via attach); lets moved nodes push new
+        # geometry into the wire directly instead of via canvas signals
+        self.source_item = None
+        self.target_item = None
+        self.input_index = 0
         
-        self.setAcceptHoverEvents(True)
+        # Hover is driven by the scene (one indexed query per mouse move)
+        # instead of per-item hover events; see CanvasScene.mouseMoveEvent
         self.setZValue(-1)  # Draw behind nodes
+
+        # Cache the stroked curve as pixels; repaints of unchanged wires
+        # become a blit instead of re-tessellating the cubic. setPath()
+        # runs prepareGeometryChange, which drops the cache when the wire
+        # actually moves, and update() drops it on state changes.
+        self.setCacheMode(QGraphicsPathItem.CacheMode.DeviceCoordinateCache)
         
         # Make wire selectable
         self.setFlag(QGraphicsPathItem.GraphicsItemFlag.ItemIsSelectable, True)
-        
+        # Without this flag option.exposedRect degrades to the full
+        # bounding rect, which would defeat the early-out in paint()
+        self.setFlag(
+            QGraphicsPathItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True
+        )
+
+        # Scene indexing hits boundingRect/shape on every mouse move and
+        # scroll; memoize both until the path actually changes
+        self._cached_bounding_rect = None
+        self._cached_shape = None
+
+        # Reusable geometry slots: _update_path runs on every drag tick,
+        # so mutate these in place instead of allocating fresh ones
+        self._ctrl1 = QPointF()
+        self._ctrl2 = QPointF()
+        self._mid = QPointF()
+        self._path = QPainterPath()
+
+        # (xs, ys) arrays for the QPainter NumPy fastpath; only kept when
+        # the curve came pre-sampled and the painter supports it
+        self._polyline_np = None
+
+        # True while a coalesced set_positions rebuild is pending
+        self._update_scheduled = False
+
         self._update_path()
     
     def set_positions(self, source: QPointF, target: QPointF) -> None:
         """Update wire endpoints."""
+        if source == self.source_pos and target == self.target_pos:
+            return
         self.source_pos = source
         self.target_pos = target
+        # Coalesce bursts (e.g. the temp wire tracking the cursor) into
+        # one rebuild per event-loop tick; the path is derived from the
+        # stored endpoints, so only the last positions matter
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            QTimer.singleShot(0, self._deferred_update)
+
+    def _deferred_update(self) -> None:
+        """Run the coalesced path rebuild scheduled by set_positions."""
+        self._update_scheduled = False
         self._update_path()
-    
+
+    def attach(self, source_item, target_item, input_index: int) -> None:
+        """Bind this wire to its endpoint node items."""
+        self.source_item = source_item
+        self.target_item = target_item
+        self.input_index = input_index
+
+    def update_from_items(self) -> None:
+        """Recompute geometry straight from the attached node items."""
+        if self.source_item is None or self.target_item is None:
+            return
+        self.source_pos = self.source_item.get_output_socket_scene_pos()
+        self.target_pos = self.target_item.get_input_socket_scene_pos(self.input_index)
+        self._update_path()
+
+    def apply_curve(self, source: QPointF, target: QPointF, points: np.ndarray) -> None:
+        """Adopt endpoints plus a pre-sampled curve from sample_wire_curves."""
+        if source == self.source_pos and target == self.target_pos:
+            return
+        self.source_pos = source
+        self.target_pos = target
+        polyline = QPolygonF([QPointF(x, y) for x, y in points])
+        path = self._path
+        path.clear()
+        path.addPolygon(polyline)
+        self.setPath(path)
+        self._polyline = polyline
+        if _HAS_DRAW_POLYLINE_NP:
+            self._polyline_np = (
+                np.ascontiguousarray(points[:, 0]),
+                np.ascontiguousarray(points[:, 1]),
+            )
+        self._cached_bounding_rect = None
+        self._cached_shape = None
+
     def set_error(self, is_error: bool) -> None:
         """Set error state (turns wire red)."""
+        if is_error == self.is_error:
+            return
         self.is_error = is_error
         self.update()
     
     def _update_path(self) -> None:
         """Recalculate the Bezier curve path."""
-        path = QPainterPath()
+        sx = self.source_pos.x()
+        tx = self.target_pos.x()
+
+        # Control points for a smooth curve; inline abs/max on scalars
+        dx = tx - sx
+        if dx < 0.0:
+            dx = -dx
+        control_offset = dx * 0.5
+        if control_offset < 50.0:
+            control_offset = 50.0  # Minimum curve offset
+
+        sy = self.source_pos.y()
+        ty = self.target_pos.y()
+        c1x = sx + control_offset  # cubic controls; c1y == sy, c2y == ty
+        c2x = tx - control_offset
+
+        # One De Casteljau split at t=0.5, then a quadratic per half:
+        # visually identical for these soft connector curves, but the
+        # stroker flattens quadratics with one less recursion level
+        m01x = (sx + c1x) * 0.5
+        m12x = (c1x + c2x) * 0.5
+        m12y = (sy + ty) * 0.5
+        m23x = (c2x + tx) * 0.5
+        m012x = (m01x + m12x) * 0.5
+        m012y = (sy + m12y) * 0.5
+        m123x = (m12x + m23x) * 0.5
+        m123y = (m12y + ty) * 0.5
+        mid_x = (m012x + m123x) * 0.5
+        mid_y = (m012y + m123y) * 0.5
+        self._mid.setX(mid_x)
+        self._mid.setY(mid_y)
+
+        # Quadratic control for a cubic half: (3*C1 + 3*C2 - P0 - P3) / 4
+        self._ctrl1.setX((3.0 * (m01x + m012x) - sx - mid_x) * 0.25)
+        self._ctrl1.setY((3.0 * (sy + m012y) - sy - mid_y) * 0.25)
+        self._ctrl2.setX((3.0 * (m123x + m23x) - mid_x - tx) * 0.25)
+        self._ctrl2.setY((3.0 * (m123y + ty) - mid_y - ty) * 0.25)
+
+        path = self._path
+        path.clear()
         path.moveTo(self.source_pos)
-        
-        # Calculate control points for smooth curve
-        dx = abs(self.target_pos.x() - self.source_pos.x())
-        control_offset = max(dx * 0.5, 50)  # Minimum curve offset
-        
-        ctrl1 = QPointF(self.source_pos.x() + control_offset, self.source_pos.y())
-        ctrl2 = QPointF(self.target_pos.x() - control_offset, self.target_pos.y())
-        
-        path.cubicTo(ctrl1, ctrl2, self.target_pos)
+        path.quadTo(self._ctrl1, self._mid)
+        path.quadTo(self._ctrl2, self.target_pos)
         self.setPath(path)
+        # Bake the flattened curve once; paint strokes the polyline so
+        # hover/selection repaints skip Qt's per-frame cubic subdivision
+        polygons = path.toSubpathPolygons(QTransform())
+        self._polyline = polygons[0] if polygons else None
+        self._polyline_np = None
+        # Drop memoized geometry only after setPath: its internal
+        # prepareGeometryChange still needs the old rect for invalidation
+        self._cached_bounding_rect = None
+        self._cached_shape = None
+
+    def boundingRect(self):
+        """Memoized bounding rect (see _update_path for invalidation)."""
+        rect = self._cached_bounding_rect
+        if rect is None:
+            # Padded so the thickened shape() stays inside; the scene
+            # index culls hit tests against this rect first
+            rect = super().boundingRect().adjusted(-6.0, -6.0, 6.0, 6.0)
+            self._cached_bounding_rect = rect
+        return rect
+
+    def shape(self) -> QPainterPath:
+        """Memoized hit-test shape (see _update_path for invalidation).
+
+        Thickened to ~12px so selecting or hovering a 2px curve doesn't
+        demand pixel-perfect aim.
+        """
+        shape = self._cached_shape
+        if shape is None:
+            stroker = QPainterPathStroker()
+            stroker.setWidth(12.0)
+            stroker.setCapStyle(Qt.PenCapStyle.RoundCap)
+            shape = stroker.createStroke(self.path())
+            self._cached_shape = shape
+        return shape
     
     def paint(self, painter: QPainter, option, widget=None) -> None:
         """Draw the wire."""
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Choose color
+        # Nothing of this wire is inside the dirty region: skip the
+        # stroke entirely
+        if option.exposedRect.isEmpty():
+            return
+
+        # Antialiasing comes from the view's render hints (set once in
+        # CanvasView); re-asserting it per item is painter state churn
+
+        # Select the prebuilt pen for the current state
         if self.isSelected():
-            color = QColor("#2196F3")  # Blue when selected
+            pen = _PEN_SELECTED
         elif self.is_error:
-            color = WIRE_ERROR_COLOR
+            pen = _PEN_ERROR
         elif self._hovered:
-            color = WIRE_HOVER_COLOR
+            pen = _PEN_HOVER
         else:
-            color = WIRE_COLOR
-        
-        # Draw wire
-        width = 4 if self.isSelected() else (3 if self._hovered else 2)
-        pen = QPen(color, width)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            pen = _PEN_NORMAL
         painter.setPen(pen)
-        painter.drawPath(self.path())
-    
-    def hoverEnterEvent(self, event) -> None:
-        """Handle hover enter."""
-        self._hovered = True
-        self.update()
-        super().hoverEnterEvent(event)
-    
-    def hoverLeaveEvent(self, event) -> None:
-        """Handle hover leave."""
-        self._hovered = False
-        self.update()
-        super().hoverLeaveEvent(event)
 
+        # Zoomed out far enough that the whole curve spans a handful of
+        # device pixels, a straight segment is indistinguishable and
+        # skips the flattened stroke. Judge by the full bounding extent —
+        # endpoint distance alone misses the >=50px control bulge of
+        # closely-stacked nodes, which is clearly curved at 100% zoom.
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        rect = self.boundingRect()
+        extent = rect.width() if rect.width() > rect.height() else rect.height()
+        if extent * lod < 20.0:
+            painter.drawLine(self.source_pos, self.target_pos)
+            return
 
-# Import Qt namespace for pen cap style
-from PySide6.QtCore import Qt
+        # drawPolyline only strokes, so no brush guard is needed even
+        # with DontSavePainterState on the view
+        if self._polyline_np is not None:
+            painter.drawPolylineNp(*self._polyline_np)
+        elif self._polyline is not None:
+            painter.drawPolyline(self._polyline)
+    
+    def _set_hovered(self, hovered: bool) -> None:
+        """Set hover state; called by the scene's hover dispatch."""
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self.update()